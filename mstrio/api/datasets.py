@@ -1,5 +1,25 @@
+import time
+from typing import TYPE_CHECKING
+
+from mstrio.helpers import IServerException
+from mstrio.utils import json_helper
 from mstrio.utils.error_handlers import ErrorHandler
 
+if TYPE_CHECKING:
+    from mstrio.utils.sessions import FuturesSessionWithRenewal
+
+
+def _json_body_kwargs(body: dict | bytes, headers: dict | None = None) -> dict:
+    """Return request arguments sending `body` as JSON. Bodies are serialized
+    with `json_helper` (fast if `orjson` is installed) and already serialized
+    bodies are sent as they are."""
+    if not isinstance(body, bytes):
+        body = json_helper.dumps(body)
+    return {
+        'data': body,
+        'headers': {**(headers or {}), 'Content-Type': 'application/json'},
+    }
+
 
 @ErrorHandler(err_msg="Error loading dataset {id} Check dataset ID")
 def dataset_definition(connection, id, fields=None, whitelist=None):
@@ -38,7 +58,7 @@ def create_dataset(connection, body):
         HTTP response object returned by the MicroStrategy REST server.
     """
     connection._validate_project_selected()
-    return connection.post(endpoint='/api/datasets', json=body)
+    return connection.post(endpoint='/api/datasets', **_json_body_kwargs(body))
 
 
 @ErrorHandler(err_msg="Error updating dataset with ID {id}")
@@ -65,8 +85,7 @@ def update_dataset(connection, id, table_name, update_policy, body):
     """
     return connection.patch(
         endpoint=f'/api/datasets/{id}/tables/{table_name}',
-        headers={'updatePolicy': update_policy},
-        json=body,
+        **_json_body_kwargs(body, headers={'updatePolicy': update_policy}),
     )
 
 
@@ -99,7 +118,7 @@ def create_multitable_dataset(connection, body):
         HTTP response object returned by the MicroStrategy REST server.
     """
     connection._validate_project_selected()
-    return connection.post(endpoint='/api/datasets/models', json=body)
+    return connection.post(endpoint='/api/datasets/models', **_json_body_kwargs(body))
 
 
 @ErrorHandler(err_msg="Error creating new data upload session.")
@@ -117,7 +136,9 @@ def upload_session(connection, id, body):
         HTTP response object returned by the MicroStrategy REST server.
     """
     connection._validate_project_selected()
-    return connection.post(endpoint=f'/api/datasets/{id}/uploadSessions', json=body)
+    return connection.post(
+        endpoint=f'/api/datasets/{id}/uploadSessions', **_json_body_kwargs(body)
+    )
 
 
 @ErrorHandler(err_msg="Error uploading data to dataset {id}")
@@ -131,19 +152,52 @@ def upload(connection, id, session_id, body, throw_error=False):
             updating a pre-existing dataset.
         session_id (str): Identifier of the server session used for collecting
             uploaded data.
-        body (dict): JSON-formatted payload containing the body of the request.
+        body (dict | bytes): JSON-formatted payload containing the body of
+            the request, or the payload already serialized to JSON.
         throw_error (bool): Flag indicates if the error should be thrown
 
+    Note:
+        Called once per uploaded chunk, so project selection is not validated
+        here. It is expected to be validated once before the upload starts.
+
     Returns:
         HTTP response object returned by the MicroStrategy REST server.
     """
-    connection._validate_project_selected()
     return connection.put(
         endpoint=f'/api/datasets/{id}/uploadSessions/{session_id}',
-        json=body,
+        **_json_body_kwargs(body),
     )
 
 
+def upload_async(
+    future_session: 'FuturesSessionWithRenewal',
+    id: str,
+    session_id: str,
+    body: dict | bytes,
+):
+    """Upload data to a multi-table dataset asynchronously.
+
+    Args:
+        future_session: `FuturesSessionWithRenewal` object to call
+            MicroStrategy REST Server asynchronously
+        id (str): Identifier of a pre-existing dataset. Used when
+            updating a pre-existing dataset.
+        session_id (str): Identifier of the server session used for collecting
+            uploaded data.
+        body (dict | bytes): JSON-formatted payload containing the body of
+            the request, or the payload already serialized to JSON.
+
+    Note:
+        Called once per uploaded chunk, so project selection is not validated
+        here. It is expected to be validated once before the upload starts.
+
+    Returns:
+        Complete Future object.
+    """
+    endpoint = f'/api/datasets/{id}/uploadSessions/{session_id}'
+    return future_session.put(endpoint=endpoint, **_json_body_kwargs(body))
+
+
 @ErrorHandler(
     err_msg="Error publishing uploaded data for dataset with ID {id} Cancelling "
     "publication."
@@ -188,6 +242,64 @@ def publish_status(connection, id, session_id):
     return connection.get(endpoint=endpoint)
 
 
+def wait_for_publish(
+    connection,
+    id: str,
+    session_id: str,
+    timeout: float | None = None,
+    poll: float = 1.0,
+    max_poll: float = 10.0,
+) -> dict:
+    """Wait until publication of a multi-table dataset is completed.
+
+    Publication status is polled with an exponential backoff: the interval
+    between requests starts at `poll` seconds and grows 1.5 times after every
+    request, up to `max_poll` seconds.
+
+    Args:
+        connection (object): MicroStrategy connection object returned by
+            `connection.Connection()`.
+        id (str): Identifier of a pre-existing dataset.
+        session_id (str): Identifier for the server session used for collecting
+            uploaded data.
+        timeout (float, optional): Maximum time in seconds to wait for the
+            publication. By default waits until it is completed.
+        poll (float): Initial interval in seconds between status requests.
+        max_poll (float): Maximum interval in seconds between status requests.
+
+    Returns:
+        Last publication status as a dictionary. In the 'status' key, "1"
+        denotes completion.
+
+    Raises:
+        IServerException: If the I-Server reports that publication failed,
+            which is denoted by a negative 'status'.
+        TimeoutError: If publication was not completed within `timeout`.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        response = publish_status(connection=connection, id=id, session_id=session_id)
+        status = json_helper.response_json(response)
+        if status['status'] == 1:
+            return status
+        if status['status'] < 0:
+            raise IServerException(
+                f"Publication of dataset with ID {id} failed with status "
+                f"{status['status']}: {status.get('message', 'no details')}"
+            )
+        delay = poll
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Publication of dataset with ID {id} was not completed in "
+                    f"{timeout} seconds."
+                )
+            delay = min(delay, remaining)
+        time.sleep(delay)
+        poll = min(poll * 1.5, max_poll)
+
+
 @ErrorHandler(err_msg="Failed to cancel the publication of dataset with ID {id}")
 def publish_cancel(connection, id, session_id, throw_error=False):
     """Delete a multi-table dataset upload session and cancel publication.
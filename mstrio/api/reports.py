@@ -101,10 +101,17 @@ def report_instance_id_coroutine(
     instance_id,
     offset=0,
     limit=5000,
+    hooks: dict | None = None,
 ):
     """Get the future of a previously created instance for a specific report
     asynchronously, using the in-memory instance created by report_instance().
 
+    Args:
+        hooks (dict, optional): Request hooks, e.g. `{'response': callback}`.
+            Response hooks are called in the worker thread, so they can be
+            used to process the response in the background. They replace
+            the hooks of the session for the same event.
+
     Returns:
         Complete Future object.
     """
@@ -113,7 +120,7 @@ def report_instance_id_coroutine(
         params['fields'] = CUBE_FIELDS
 
     endpoint = f'/api/v2/reports/{report_id}/instances/{instance_id}'
-    future = future_session.get(endpoint=endpoint, params=params)
+    future = future_session.get(endpoint=endpoint, params=params, hooks=hooks)
     return future
 
 
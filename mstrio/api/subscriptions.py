@@ -275,6 +275,27 @@ def remove_subscription(
     return response
 
 
+def remove_subscription_async(
+    future_session: 'FuturesSessionWithRenewal', subscription_id, project_id
+) -> 'Future':
+    """Remove (Unsubscribe) the subscription using subscription id
+    asynchronously.
+
+    Args:
+        future_session: Future Session object to call MicroStrategy REST
+            Server asynchronously
+        subscription_id (str): ID of the subscription
+        project_id (str): ID of the project
+
+    Returns:
+        Complete Future object.
+    """
+    endpoint = '/api/subscriptions/' + subscription_id
+    headers = {'X-MSTR-ProjectID': project_id}
+
+    return future_session.delete(endpoint=endpoint, headers=headers)
+
+
 @ErrorHandler(err_msg="Error deleting Dynamic Recipient List ID: {id}.")
 def remove_dynamic_recipient_list(
     connection: 'Connection', id: str, project_id: str, error_msg: str | None = None
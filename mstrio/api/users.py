@@ -214,6 +214,25 @@ def get_addresses_v2(connection, id, fields=None):
     )
 
 
+def get_addresses_v2_async(
+    future_session: 'FuturesSessionWithRenewal', id: str, fields=None
+):
+    """Get all of the addresses for a specific user asynchronously.
+
+    Args:
+        future_session: Future Session object to call MicroStrategy REST
+            Server asynchronously
+        id (str): User ID
+        fields (list, optional): Comma separated top-level field whitelist. This
+            allows client to selectively retrieve part of the response model.
+
+    Returns:
+        Complete Future object.
+    """
+    endpoint = f'/api/v2/users/{id}/addresses'
+    return future_session.get(endpoint=endpoint, params={'fields': fields})
+
+
 @ErrorHandler(err_msg="Error creating a new address for user with ID {id}")
 def create_address(connection, id, body, fields=None):
     """Create a new address for a specific user.
@@ -365,6 +384,24 @@ def get_user_security_roles(connection, id, project_id=None):
     )
 
 
+def get_user_security_roles_async(
+    future_session: 'FuturesSessionWithRenewal', id: str, project_id=None
+):
+    """Get all of the security roles for a specific user in a specific project
+    asynchronously.
+
+    Args:
+        future_session: Future Session object to call MicroStrategy REST
+            Server asynchronously
+        id (str): User ID
+
+    Returns:
+        Complete Future object.
+    """
+    endpoint = f'/api/users/{id}/securityRoles'
+    return future_session.get(endpoint=endpoint, params={'projectId': project_id})
+
+
 @ErrorHandler(err_msg="Error getting user {id} privileges for a project")
 def get_user_privileges(connection, id, project_id=None, privilege_level=None):
     """Get user"s privileges of a project including the source of the
@@ -386,6 +423,30 @@ def get_user_privileges(connection, id, project_id=None, privilege_level=None):
     )
 
 
+def get_user_privileges_async(
+    future_session: 'FuturesSessionWithRenewal',
+    id: str,
+    project_id=None,
+    privilege_level=None,
+):
+    """Get user"s privileges of a project including the source of the
+    privileges asynchronously.
+
+    Args:
+        future_session: Future Session object to call MicroStrategy REST
+            Server asynchronously
+        id (str): User ID
+        project_id (string, optional): Project ID
+        privilege_level (string, optional): Project Level Privilege
+
+    Returns:
+        Complete Future object.
+    """
+    endpoint = f'/api/users/{id}/privileges/'
+    params = {'privilege.level': privilege_level, 'projectId': project_id}
+    return future_session.get(endpoint=endpoint, params=params)
+
+
 @ErrorHandler(err_msg="Error getting user data usage limit for project with ID {id}")
 def get_user_data_usage_limit(connection, id, project_id):
     """Get the data usage limit for users, either all users or a specific user,
@@ -424,6 +485,23 @@ def get_user_info(connection, id, fields=None):
     return connection.get(endpoint=f'/api/users/{id}', params={'fields': fields})
 
 
+def get_user_info_async(future_session: 'FuturesSessionWithRenewal', id, fields=None):
+    """Get information for a specific user asynchronously.
+
+    Args:
+        future_session: Future Session object to call MicroStrategy REST
+            Server asynchronously
+        id (string): User ID.
+        fields (list, optional): Comma separated top-level field whitelist. This
+            allows client to selectively retrieve part of the response model.
+
+    Returns:
+        Complete Future object.
+    """
+    endpoint = f'/api/users/{id}'
+    return future_session.get(endpoint=endpoint, params={'fields': fields})
+
+
 @ErrorHandler(err_msg="Error deleting user with ID {id}")
 def delete_user(connection, id):
     """Delete user for specific user id.
@@ -528,3 +606,37 @@ def get_security_filters(
 
     params = {'projects.id': projects, 'offset': offset, 'limit': limit}
     return connection.get(endpoint=endpoint, params=params)
+
+
+def get_security_filters_async(
+    future_session: 'FuturesSessionWithRenewal',
+    id: str,
+    projects: str | list[str] | None = None,
+    offset: int = 0,
+    limit: int = -1,
+):
+    """Get each project level security filter and its corresponding inherited
+    security filters for the user with given ID asynchronously.
+
+    Args:
+        future_session: Future Session object to call MicroStrategy REST
+            Server asynchronously
+        id (string): User ID
+        projects (str or list of str, optional): collection of projects' ids
+            which is used for filtering data
+        offset (int, optional): Starting point within the collection of returned
+            results. Used to control paging behavior. Default is 0.
+        limit (int, optional): Maximum number of items returned for a single
+            request. Used to control paging behavior. Use -1 for no limit.
+            Default is -1.
+
+    Returns:
+        Complete Future object.
+    """
+    endpoint = f'/api/users/{id}/securityFilters'
+
+    if projects and isinstance(projects, list):
+        projects = ','.join(projects)
+
+    params = {'projects.id': projects, 'offset': offset, 'limit': limit}
+    return future_session.get(endpoint=endpoint, params=params)
@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 from base64 import b64encode
 from datetime import datetime
 from getpass import getpass
@@ -143,6 +144,8 @@ class Connection:
         timeout: time after the server's session expires, in seconds
     """
 
+    _futures_session_lock = threading.Lock()
+
     def __init__(
         self,
         base_url: str,
@@ -203,6 +206,7 @@ class Connection:
         self.certificate_path = certificate_path
         self.identity_token = identity_token
         self._session = self.__configure_session(ssl_verify, certificate_path, proxies)
+        self._futures_session = None
         self._web_version = None
         self._iserver_version = None
         self._user_id = None
@@ -306,6 +310,9 @@ class Connection:
         """Closes a connection with MicroStrategy REST API."""
         authentication.logout(connection=self, whitelist=[('ERR009', 401)])
 
+        if self._futures_session is not None:
+            self._futures_session.close()
+            self._futures_session = None
         self._session.close()
 
         self.token = None
@@ -438,6 +445,22 @@ class Connection:
         """Sends a HEAD request."""
         return self._request('HEAD', url, endpoint, **kwargs)
 
+    def _get_futures_session(self) -> sessions.FuturesSessionWithRenewal:
+        """Return futures session shared by asynchronous requests made with
+        this connection, so its worker threads are not started again for every
+        batch of requests. It is created on first use and closed together with
+        the connection.
+
+        Futures have to be consumed by the caller, the session is not meant to
+        be used as a context manager.
+        """
+        with self._futures_session_lock:
+            if self._futures_session is None:
+                self._futures_session = sessions.FuturesSessionWithRenewal(
+                    connection=self, max_workers=helper.get_parallel_number(0)
+                )
+            return self._futures_session
+
     def _status(self):
         return authentication.session_status(connection=self)
 
@@ -515,6 +538,8 @@ class Connection:
         existing_session=None,
         retries=2,
         backoff_factor=0.3,
+        pool_connections=16,
+        pool_maxsize=32,
     ):
         """Creates a shared requests.Session() object with configuration from
         the initialization. Additional parameters change how the HTTPAdapter is
@@ -533,6 +558,12 @@ class Connection:
                 for [0.0s, 0.2s, 0.4s, ...] between retries. It will never be
                 longer than Retry. BACKOFF_MAX. By default, backoff is disabled
                 (set to 0).
+            pool_connections (int, optional): number of connection pools to
+                cache, one per host
+            pool_maxsize (int, optional): maximum number of kept-alive
+                connections in each pool; should not be lower than the number
+                of threads used for parallel requests, otherwise connections
+                are discarded and re-established with every request
         """
         session = existing_session or Session()
         session.proxies = proxies or {}
@@ -546,7 +577,8 @@ class Connection:
         if response_hooks:
             session.hooks['response'] = response_hooks
 
-        status_forcelist = frozenset([413, 429, 500, 503])  # retry after status
+        # retry after status
+        status_forcelist = frozenset([413, 429, 500, 502, 503, 504])
 
         retry = Retry(
             total=retries,
@@ -556,7 +588,11 @@ class Connection:
             status_forcelist=status_forcelist,
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
         session.mount('http://', adapter)
         session.mount('https://', adapter)
 
@@ -1,6 +1,5 @@
 import logging
-
-from packaging import version
+from types import MappingProxyType
 
 from mstrio import config
 from mstrio.api import events
@@ -9,17 +8,38 @@ from mstrio.utils import helper
 from mstrio.utils.entity import DeleteMixin, Entity, ObjectTypes
 from mstrio.utils.response_processors import objects as objects_processors
 from mstrio.utils.translation_mixin import TranslationMixin
-from mstrio.utils.version_helper import class_version_handler, method_version_handler
+from mstrio.utils.version_helper import (
+    class_version_handler,
+    is_web_min_version,
+    method_version_handler,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@helper.cache_per_connection(ttl=60, cache_empty=False)
+def _fetch_events(connection: Connection, limit: int | None, **filters) -> list[dict]:
+    return helper.fetch_objects(
+        connection=connection,
+        api=events.list_events,
+        limit=limit,
+        filters=filters,
+        dict_unpack_value='events',
+    )
+
+
 @method_version_handler('11.3.0100')
 def list_events(
     connection: Connection, to_dictionary: bool = False, limit: int = None, **filters
 ) -> list["Event"] | list[dict]:
     """List event objects or event dictionaries. Optionally filter list.
 
+    Note:
+        Events are cached per connection for 60 seconds, empty results are
+        not cached. Creating, altering or deleting an event through mstrio
+        clears the cache of all connections. To discard changes made
+        elsewhere, call `list_events.cache_clear()`.
+
     Args:
         connection(object): MicroStrategy connection object returned
             by 'connection.Connection()'
@@ -29,13 +49,7 @@ def list_events(
         **filters: Available filter parameters:
             ['name', 'id', 'description', 'acg']
     """
-    _objects = helper.fetch_objects(
-        connection=connection,
-        api=events.list_events,
-        limit=limit,
-        filters=filters,
-        dict_unpack_value='events',
-    )
+    _objects = _fetch_events(connection, limit=limit, **filters)
 
     if to_dictionary:
         return _objects
@@ -43,6 +57,17 @@ def list_events(
         return [Event.from_dict(source=obj, connection=connection) for obj in _objects]
 
 
+list_events.cache_clear = _fetch_events.cache_clear
+
+
+def _get_event_info(connection: Connection, id: str, object_type: int) -> dict:
+    # dedicated events endpoint is available since MicroStrategy Web 11.3.0200;
+    # choosing it per call keeps `Event._API_GETTERS` independent of connection
+    if is_web_min_version(connection, '11.3.0200'):
+        return events.get_event(connection, id).json()
+    return objects_processors.get_info(connection, id, object_type)
+
+
 @class_version_handler('11.3.0100')
 class Event(Entity, DeleteMixin, TranslationMixin):
     """Class representation of MicroStrategy Event object.
@@ -56,26 +81,31 @@ class Event(Entity, DeleteMixin, TranslationMixin):
 
     _PATCH_PATH_TYPES = {'name': str, 'description': str}
     _OBJECT_TYPE = ObjectTypes.SCHEDULE_EVENT
-    _API_GETTERS = {
-        (
-            'abbreviation',
-            'type',
-            'subtype',
-            'ext_type',
-            'date_created',
-            'date_modified',
-            'version',
-            'owner',
-            'icon_path',
-            'view_media',
-            'ancestors',
-            'certified_info',
-            'acg',
-            'acl',
-        ): objects_processors.get_info,
-    }
+    _API_GETTERS = MappingProxyType(
+        {
+            (
+                'abbreviation',
+                'type',
+                'subtype',
+                'ext_type',
+                'date_created',
+                'date_modified',
+                'version',
+                'owner',
+                'icon_path',
+                'view_media',
+                'ancestors',
+                'certified_info',
+                'acg',
+                'acl',
+            ): objects_processors.get_info,
+            ('id', 'name', 'description'): _get_event_info,
+        }
+    )
     _API_DELETE = staticmethod(events.delete_event)
-    _API_PATCH = {('name', 'description'): (events.update_event, 'put')}
+    _API_PATCH = MappingProxyType(
+        {('name', 'description'): (events.update_event, 'put')}
+    )
 
     def __init__(
         self,
@@ -93,12 +123,6 @@ class Event(Entity, DeleteMixin, TranslationMixin):
             id: Event ID
             name: Event name
         """
-        self._API_GETTERS[('id', 'name', 'description')] = (
-            events.get_event
-            if version.parse(connection.web_version) >= version.parse('11.3.0200')
-            else objects_processors.get_info
-        )
-
         if id is None and name is None:
             raise AttributeError(
                 "Please specify either 'name' or 'id' parameter in the constructor."
@@ -113,6 +137,29 @@ class Event(Entity, DeleteMixin, TranslationMixin):
         else:
             super().__init__(connection=connection, object_id=id, name=name)
 
+    @classmethod
+    def bulk_from_names(cls, connection: Connection, names: list[str]) -> list["Event"]:
+        """Initialize Event objects for all given names with a single request
+        listing events, instead of one request per name.
+
+        Args:
+            connection: MicroStrategy connection object returned
+                by `connection.Connection()`.
+            names: list of Event names
+
+        Returns:
+            List of Event objects in order of `names`. Names for which there is
+            no event are skipped.
+        """
+        events_by_name = {}
+        for event in list_events(connection, to_dictionary=True):
+            events_by_name.setdefault(event['name'], event)
+        return [
+            cls.from_dict(source=event, connection=connection)
+            for name in names
+            if (event := events_by_name.get(name))
+        ]
+
     def trigger(self):
         """Trigger the Event"""
         response = events.trigger_event(self.connection, self.id)
@@ -134,16 +181,30 @@ class Event(Entity, DeleteMixin, TranslationMixin):
             name: Name of the new Event
             description: Description of the new Event
         """
-        body = helper.delete_none_values(
-            {
-                "name": name,
-                "description": description,
-            },
-            recursion=True,
-        )
+        body = {
+            key: value
+            for key, value in (("name", name), ("description", description))
+            if value is not None
+        }
         response = events.create_event(connection, body)
+        list_events.cache_clear()
         return cls.from_dict(response.json(), connection)
 
+    def delete(self, force: bool = False) -> bool:
+        """Delete the Event.
+
+        Args:
+            force: If True, then no additional prompt will be shown before
+                deleting the Event.
+
+        Returns:
+            True on success. False otherwise.
+        """
+        deleted = super().delete(force=force)
+        if deleted:
+            list_events.cache_clear()
+        return deleted
+
     def alter(self, name: str | None = None, description: str | None = None):
         """Alter the Event's properties
 
@@ -151,13 +212,17 @@ class Event(Entity, DeleteMixin, TranslationMixin):
             name: New name for the Event
             description: New description for the Event
         """
-        args = helper.delete_none_values(
-            {
-                "name": name,
-                "description": description,
-            },
-            recursion=True,
-        )
+        args = {
+            key: value
+            for key, value in (("name", name), ("description", description))
+            if value is not None
+        }
         self._alter_properties(**args)
         if config.verbose:
             logger.info(f"Updated subscription '{self.name}' with ID: {self.id}.")
+
+    def _alter_properties(self, **properties) -> None:
+        # used by `alter` and `update_properties`, so both invalidate the cache
+        super()._alter_properties(**properties)
+        if properties:
+            list_events.cache_clear()
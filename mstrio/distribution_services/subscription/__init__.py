@@ -16,4 +16,8 @@ from .email_subscription import EmailSubscription
 from .file_subscription import FileSubscription
 from .ftp_subscription import FTPSubscription
 from .history_list_subscription import HistoryListSubscription
-from .subscription_manager import SubscriptionManager, list_subscriptions
+from .subscription_manager import (
+    SubscriptionManager,
+    iter_subscriptions,
+    list_subscriptions,
+)
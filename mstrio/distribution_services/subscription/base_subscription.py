@@ -34,6 +34,18 @@ from mstrio.utils.version_helper import method_version_handler
 logger = logging.getLogger(__name__)
 
 
+def _clear_subscriptions_cache(connection: Connection) -> None:
+    # imported here to avoid circular import with subscription manager
+    from mstrio.distribution_services.subscription.subscription_manager import (
+        _clear_metadata_cache,
+        list_subscriptions,
+    )
+
+    # other connections may list the same project, so all of them are cleared
+    list_subscriptions.cache_clear()
+    _clear_metadata_cache(connection)
+
+
 class RecipientsTypes(AutoUpperName):
     CONTACT_GROUP = auto()
     USER_GROUP = auto()
@@ -409,6 +421,7 @@ class Subscription(EntityBase):
         )
 
         if response.ok:
+            _clear_subscriptions_cache(self.connection)
             response = response.json()
             response = helper.camel_to_snake(response)
             self._set_object_attributes(**response)
@@ -483,12 +496,22 @@ class Subscription(EntityBase):
             response = subscriptions.remove_subscription(
                 self.connection, self.id, self.project_id
             )
-            if response.ok and config.verbose:
-                logger.info(f"Deleted subscription '{self.name}' with ID: {self.id}.")
+            if response.ok:
+                _clear_subscriptions_cache(self.connection)
+                if config.verbose:
+                    logger.info(
+                        f"Deleted subscription '{self.name}' with ID: {self.id}."
+                    )
             return response.ok
         else:
             return False
 
+    def _alter_properties(self, **properties) -> None:
+        # used by `update_properties`, `alter` clears the cache on its own
+        super()._alter_properties(**properties)
+        if properties:
+            _clear_subscriptions_cache(self.connection)
+
     @method_version_handler('11.3.0000')
     def available_bursting_attributes(self) -> dict:
         """Get a list of available attributes for bursting feature."""
@@ -1002,6 +1025,7 @@ class Subscription(EntityBase):
 
         body = helper.delete_none_values(body, recursion=True)
         response = subscriptions.create_subscription(connection, project_id, body)
+        _clear_subscriptions_cache(connection)
         if config.verbose:
             unpacked_response = response.json()
             logger.info(
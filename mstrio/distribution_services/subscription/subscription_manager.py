@@ -1,13 +1,17 @@
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-from packaging import version
-
 from mstrio import config
 from mstrio.api import subscriptions as subscriptions_
 from mstrio.connection import Connection
 from mstrio.utils import helper
-from mstrio.utils.version_helper import class_version_handler, method_version_handler
+from mstrio.utils.version_helper import (
+    class_version_handler,
+    is_server_min_version,
+    method_version_handler,
+)
 
 from . import (
     CacheUpdateSubscription,
@@ -17,12 +21,35 @@ from . import (
     HistoryListSubscription,
     Subscription,
 )
+from .base_subscription import _clear_subscriptions_cache
 from .content import Content
 from .delivery import Delivery
 
 logger = logging.getLogger(__name__)
 
 
+def _subscriptions_chunk_size(connection: Connection) -> int:
+    return 1000 if is_server_min_version(connection, '11.3.0300') else 1000000
+
+
+@helper.cache_per_connection(ttl=60, cache_empty=False)
+def _fetch_subscriptions(
+    connection: Connection, project_id: str, limit: int | None, **filters
+) -> list[dict]:
+    msg = 'Error getting subscription list.'
+    return helper.fetch_objects_async(
+        connection=connection,
+        api=subscriptions_.list_subscriptions,
+        async_api=subscriptions_.list_subscriptions_async,
+        limit=limit,
+        chunk_size=_subscriptions_chunk_size(connection),
+        filters=filters,
+        error_msg=msg,
+        dict_unpack_value="subscriptions",
+        project_id=project_id,
+    )
+
+
 @method_version_handler('11.2.0203')
 def list_subscriptions(
     connection: Connection,
@@ -39,6 +66,12 @@ def list_subscriptions(
     Specify either `project_id` or `project_name`.
     When `project_id` is provided (not `None`), `project_name` is omitted.
 
+    Note:
+        Subscriptions are cached per connection for 60 seconds, empty results
+        are not cached. Creating, altering or deleting a subscription through
+        mstrio clears the cache of all connections. To discard changes made
+        elsewhere, call `list_subscriptions.cache_clear()`.
+
     Args:
         connection(object): MicroStrategy connection object
         project_id: Project ID
@@ -57,35 +90,65 @@ def list_subscriptions(
         project_id=project_id,
         project_name=project_name,
     )
-    chunk_size = (
-        1000
-        if version.parse(connection.iserver_version) >= version.parse('11.3.0300')
-        else 1000000
+    objects = _fetch_subscriptions(
+        connection, project_id=project_id, limit=limit, **filters
     )
-    msg = 'Error getting subscription list.'
-    objects = helper.fetch_objects_async(
+
+    if to_dictionary:
+        return objects
+    else:
+        return list(_dispatch_from_dicts(objects, connection, project_id))
+
+
+list_subscriptions.cache_clear = _fetch_subscriptions.cache_clear
+
+
+@method_version_handler('11.2.0203')
+def iter_subscriptions(
+    connection: Connection,
+    project_id: str | None = None,
+    project_name: str | None = None,
+    limit: int | None = None,
+    **filters,
+) -> Iterator["Subscription"]:
+    """Iterate over all subscriptions per project. Subscriptions are
+    downloaded in chunks, a few of them ahead of the consumer, and Subscription
+    objects are created as they are consumed, which keeps memory usage low for
+    projects with many subscriptions. Unlike `list_subscriptions`, results are
+    not cached.
+
+    Optionally filter the subscriptions by specifying filters.
+    Specify either `project_id` or `project_name`.
+    When `project_id` is provided (not `None`), `project_name` is omitted.
+
+    Args:
+        connection(object): MicroStrategy connection object
+        project_id: Project ID
+        project_name: Project name
+        limit: limit the number of elements returned. If `None` (default), all
+            objects are returned.
+        **filters: Available filter parameters: ['id', 'multiple_contents',
+            'name', 'editable', 'allow_delivery_changes'
+            'allow_personalization_changes', 'allow_unsubscribe',
+            'date_created', 'date_modified', 'owner', 'delivery']
+    """
+    project_id = helper.get_valid_project_id(
+        connection=connection,
+        project_id=project_id,
+        project_name=project_name,
+    )
+    for objects in helper.iter_objects_async(
         connection=connection,
         api=subscriptions_.list_subscriptions,
         async_api=subscriptions_.list_subscriptions_async,
         limit=limit,
-        chunk_size=chunk_size,
+        chunk_size=_subscriptions_chunk_size(connection),
         filters=filters,
-        error_msg=msg,
+        error_msg='Error getting subscription list.',
         dict_unpack_value="subscriptions",
         project_id=project_id,
-    )
-
-    if to_dictionary:
-        return objects
-    else:
-        return [
-            dispatch_from_dict(
-                source=obj,
-                connection=connection,
-                project_id=project_id,
-            )
-            for obj in objects
-        ]
+    ):
+        yield from _dispatch_from_dicts(objects, connection, project_id)
 
 
 DeliveryMode = Delivery.DeliveryMode
@@ -96,6 +159,45 @@ subscription_type_from_delivery_mode_dict = {
     DeliveryMode.FTP: FTPSubscription,
     DeliveryMode.HISTORY_LIST: HistoryListSubscription,
 }
+# keyed by raw delivery mode values to skip `DeliveryMode` lookup per object
+_SUB_BY_MODE_STR = {
+    mode.value: sub_type
+    for mode, sub_type in subscription_type_from_delivery_mode_dict.items()
+}
+
+_EXECUTABLE_MODES = frozenset({'EMAIL', 'FILE', 'HISTORY_LIST', 'FTP'})
+
+
+@helper.cache_per_connection(maxsize=500)
+def _fetch_bursting_attributes(
+    connection: Connection, project_id: str, content_id: str, content_type: str
+) -> list[dict]:
+    response = subscriptions_.bursting_attributes(
+        connection, project_id, content_id, content_type
+    )
+    return response.json()['burstingAttributes']
+
+
+@helper.cache_per_connection(maxsize=500)
+def _fetch_available_recipients(
+    connection: Connection,
+    project_id: str,
+    content_id: str,
+    content_type: str,
+    delivery_type: str,
+) -> list[dict]:
+    body = {
+        "contents": [{"id": content_id, "type": content_type}],
+    }
+    response = subscriptions_.available_recipients(
+        connection, project_id, body, delivery_type
+    )
+    return response.json()['recipients']
+
+
+def _clear_metadata_cache(connection: Connection | None = None) -> None:
+    _fetch_bursting_attributes.cache_clear(connection)
+    _fetch_available_recipients.cache_clear(connection)
 
 
 def get_subscription_type_from_delivery_mode(mode: DeliveryMode):
@@ -115,11 +217,24 @@ def dispatch_from_dict(source: dict, connection: Connection, project_id: str):
         connection: MicroStrategy connection object returned
             by `connection.Connection()`
         project_id: Project ID"""
-    delivery_mode = DeliveryMode(source["delivery"]["mode"])
-    sub_type = get_subscription_type_from_delivery_mode(delivery_mode)
+    sub_type = _SUB_BY_MODE_STR.get(source["delivery"]["mode"], Subscription)
     return sub_type.from_dict(source, connection, project_id)
 
 
+def _dispatch_from_dicts(
+    sources: list[dict], connection: Connection, project_id: str
+) -> Iterator["Subscription"]:
+    # resolve everything possible once, not for every subscription
+    sub_type_by_mode = _SUB_BY_MODE_STR.get
+    from_dict = {
+        sub_type: sub_type.from_dict
+        for sub_type in [*_SUB_BY_MODE_STR.values(), Subscription]
+    }
+    for source in sources:
+        sub_type = sub_type_by_mode(source["delivery"]["mode"], Subscription)
+        yield from_dict[sub_type](source, connection, project_id)
+
+
 @class_version_handler('11.2.0203')
 class SubscriptionManager:
     """Manage subscriptions."""
@@ -181,6 +296,11 @@ class SubscriptionManager:
 
         Args:
             subscriptions: list of subscriptions to be deleted
+            force: If True, no additional prompt will be shown before deleting
+
+        Raises:
+            RuntimeError: If `force` is False and deletion cannot be
+                confirmed because no input is available.
         """
         subscriptions = (
             subscriptions if isinstance(subscriptions, list) else [subscriptions]
@@ -208,30 +328,49 @@ class SubscriptionManager:
                 print("Found subscriptions:")
                 for sub in to_be_deleted:
                     print(sub)
-                user_input = input(
-                    "Are you sure you want to delete all of them? [Y/N]: "
-                )
+                try:
+                    user_input = input(
+                        "Are you sure you want to delete all of them? [Y/N]: "
+                    )
+                except EOFError:
+                    raise RuntimeError(
+                        "Cannot ask for deletion confirmation as there is no "
+                        "input available. Pass `force=True` to delete "
+                        "subscriptions."
+                    ) from None
             if force or user_input == 'Y':
                 succeeded = 0
-                for subscription in subscriptions:
-                    response = subscriptions_.remove_subscription(
-                        self.connection,
-                        subscription.id,
-                        self.project_id,
-                        error_msg=(
-                            f"Subscription '{subscription.name}' with id "
-                            f"'{subscription.id}' could not be deleted."
-                        ),
-                        exception_type=UserWarning,
-                    )
-                    if response.ok:
-                        succeeded += 1
-                        if config.verbose:
-                            logger.info(
-                                f"Deleted subscription '{subscription.name}' "
-                                f"with ID '{subscription.id}'."
+                session = self.connection._get_futures_session()
+                futures = {
+                    subscriptions_.remove_subscription_async(
+                        session, subscription.id, self.project_id
+                    ): subscription
+                    for subscription in subscriptions
+                }
+                try:
+                    for future in as_completed(futures):
+                        subscription = futures[future]
+                        response = future.result()
+                        if response.ok:
+                            succeeded += 1
+                            if config.verbose:
+                                logger.info(
+                                    f"Deleted subscription '{subscription.name}' "
+                                    f"with ID '{subscription.id}'."
+                                )
+                        else:
+                            helper.response_handler(
+                                response,
+                                f"Subscription '{subscription.name}' with id "
+                                f"'{subscription.id}' could not be deleted.",
+                                throw_error=False,
                             )
-
+                finally:
+                    # on error, do not send requests which are still queued;
+                    # some subscriptions may have been deleted either way
+                    for future in futures:
+                        future.cancel()
+                    _clear_subscriptions_cache(self.connection)
                 return succeeded == len(subscriptions)
 
     def execute(self, subscriptions: list[Subscription] | list[str]):
@@ -240,39 +379,49 @@ class SubscriptionManager:
         Args:
             subscriptions: list of subscriptions to be executed
         """
-        if not subscriptions and config.verbose:
-            logger.info('No subscriptions passed.')
-        else:
-            subscriptions = (
-                subscriptions if isinstance(subscriptions, list) else [subscriptions]
+        if not subscriptions:
+            if config.verbose:
+                logger.info('No subscriptions passed.')
+            return
+        subscriptions = (
+            subscriptions if isinstance(subscriptions, list) else [subscriptions]
+        )
+        threads = helper.get_parallel_number(len(subscriptions))
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            failures = [
+                msg for msg in executor.map(self.__execute_single, subscriptions) if msg
+            ]
+        if failures:
+            helper.exception_handler('\n'.join(failures), UserWarning)
+
+    def __execute_single(self, subscription: Subscription | str) -> str | None:
+        """Execute a single subscription. Return message describing why the
+        subscription could not be executed or None if it was executed."""
+        if not isinstance(subscription, Subscription):
+            subscription = Subscription(
+                connection=self.connection,
+                id=subscription,
+                project_id=self.project_id,
             )
-            for subscription in subscriptions:
-                if not isinstance(subscription, Subscription):
-                    subscription = Subscription(
-                        connection=self.connection,
-                        id=subscription,
-                        project_id=self.project_id,
-                    )
-                if subscription.delivery.mode in (
-                    'EMAIL',
-                    'FILE',
-                    'HISTORY_LIST',
-                    'FTP',
-                ):
-                    subscription.execute()
-                else:
-                    msg = (
-                        f"Subscription '{subscription.name}' with ID "
-                        f"'{subscription.id}' could not be executed. Delivery mode "
-                        f"'{subscription.delivery.mode}' is not supported."
-                    )
-                    helper.exception_handler(msg, UserWarning)
+        mode = subscription.delivery.mode
+        if mode not in _EXECUTABLE_MODES:
+            return (
+                f"Subscription '{subscription.name}' with ID "
+                f"'{subscription.id}' could not be executed. Delivery mode "
+                f"'{mode}' is not supported."
+            )
+        subscription.execute()
+        return None
 
     @method_version_handler('11.3.0000')
     def available_bursting_attributes(self, content: dict | Content):
         """Get a list of available attributes for bursting feature, for a given
         content.
 
+        Note:
+            Results are cached per connection. Call `clear_metadata_cache()`
+            to discard them.
+
         Args:
             content: content dictionary or Content object
                 (from subscription.content)
@@ -280,13 +429,10 @@ class SubscriptionManager:
         c_id = content['id'] if isinstance(content, dict) else content.id
         c_type = content['type'] if isinstance(content, dict) else content.type
 
-        response = subscriptions_.bursting_attributes(
+        return _fetch_bursting_attributes(
             self.connection, self.project_id, c_id, c_type.upper()
         )
 
-        if response.ok:
-            return response.json()['burstingAttributes']
-
     @method_version_handler('11.3.0000')
     def available_recipients(
         self,
@@ -299,6 +445,10 @@ class SubscriptionManager:
         Specify either both `content_id` and `content_type` or just `content`
         object.
 
+        Note:
+            Results are cached per connection. Call `clear_metadata_cache()`
+            to discard them.
+
         Args:
             content_id: ID of the content
             content_type: type of the content
@@ -316,13 +466,14 @@ class SubscriptionManager:
                 'Specify either a content ID and type or content object.', ValueError
             )
 
-        body = {
-            "contents": [{"id": content_id, "type": content_type}],
-        }
-
-        response = subscriptions_.available_recipients(
-            self.connection, self.project_id, body, delivery_type
+        recipients = _fetch_available_recipients(
+            self.connection, self.project_id, content_id, content_type, delivery_type
         )
 
-        if response.ok and config.verbose:
-            return response.json()['recipients']
+        if config.verbose:
+            return recipients
+
+    def clear_metadata_cache(self) -> None:
+        """Clear cached results of `available_bursting_attributes` and
+        `available_recipients` for the connection of this manager."""
+        _clear_metadata_cache(self.connection)
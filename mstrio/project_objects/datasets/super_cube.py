@@ -1,6 +1,6 @@
 import logging
 import math
-import time
+from collections import deque
 from dataclasses import dataclass
 
 import pandas as pd
@@ -15,7 +15,7 @@ from mstrio.object_management import (
     get_predefined_folder_contents,
 )
 from mstrio.object_management.search_operations import SearchPattern, full_search
-from mstrio.utils import helper
+from mstrio.utils import helper, json_helper
 from mstrio.utils.encoder import Encoder
 from mstrio.utils.entity import CertifyMixin, ObjectSubTypes
 from mstrio.utils.model import Model
@@ -224,8 +224,8 @@ class SuperCube(_Cube, CertifyMixin):
             progress_bar(bool, optional): If True (default), show the upload
                 progress bar.
             parallel (bool, optional): If True (default), utilize optimal number
-                of threads to increase the download speed. If False, this
-                feature will be disabled.
+                of threads to increase the download and upload speed. If False,
+                this feature will be disabled.
         """
         if name is not None:
             self.__check_param_str(name, msg="Super cube name should be a string.")
@@ -461,7 +461,7 @@ class SuperCube(_Cube, CertifyMixin):
         response = datasets.create_multitable_dataset(
             connection=self._connection, body=self.__model
         )
-        self._set_object_attributes(**response.json())
+        self._set_object_attributes(**json_helper.response_json(response))
 
         if config.verbose:
             logger.info(
@@ -485,6 +485,9 @@ class SuperCube(_Cube, CertifyMixin):
                 simply updates the super cube but does not publish it.
         """
 
+        # chunk uploads do not validate project selection on each request
+        self._connection._validate_project_selected()
+
         # form request body and create a session for data uploads
         self.__form_upload_body()
 
@@ -492,8 +495,7 @@ class SuperCube(_Cube, CertifyMixin):
             response = datasets.upload_session(
                 connection=self._connection, id=self._id, body=self.__upload_body
             )
-            response_json = response.json()
-            self._session_id = response_json['uploadSessionId']
+            self._session_id = json_helper.response_json(response)['uploadSessionId']
             self.__last_session_id = None
 
         # upload each table
@@ -509,42 +511,22 @@ class SuperCube(_Cube, CertifyMixin):
             it_total = math.ceil(total / chunksize)
 
             pbar = tqdm(chunks, total=it_total, disable=(not self._progress_bar))
-            for index, chunk in enumerate(pbar):
-                pbar.set_description(f"Uploading {ix + 1}/{len(self._tables)}")
-
-                # base64 encode the data
-                encoder = Encoder(data_frame=chunk, dataset_type='multi')
-                b64_enc = encoder.encode
-
-                # form body of the request
-                body = {
-                    "tableName": _name,
-                    "index": self.__update_indexes.get(_name, 0) + index + 1,
-                    "data": b64_enc,
-                }
+            pbar.set_description(f"Uploading {ix + 1}/{len(self._tables)}")
+            if self._parallel and it_total > 1:
+                uploaded = self.__upload_chunks_async(_name, pbar, chunksize, total)
+            else:
+                uploaded = self.__upload_chunks(_name, pbar, chunksize, total)
+            pbar.close()
 
-                # make request to upload the data
-                response = datasets.upload(
+            if not uploaded:
+                # on error, cancel the previously uploaded data
+                datasets.publish_cancel(
                     connection=self._connection,
                     id=self._id,
                     session_id=self._session_id,
-                    body=body,
-                    throw_error=False,
                 )
-
-                if not response.ok:
-                    # on error, cancel the previously uploaded data
-                    datasets.publish_cancel(
-                        connection=self._connection,
-                        id=self._id,
-                        session_id=self._session_id,
-                    )
-                    self.reset_session()
-                    pbar.close()
-                    return
-
-                pbar.set_postfix(rows=min((index + 1) * chunksize, total))
-            pbar.close()
+                self.reset_session()
+                return
 
             # prepare index in case of the next update operation for this table
             # without publishing
@@ -555,6 +537,94 @@ class SuperCube(_Cube, CertifyMixin):
         if auto_publish:
             self.publish()
 
+    def __form_chunk_body(self, table_name: str, index: int, chunk) -> bytes:
+        """Form serialized body of the request uploading a single chunk of
+        a table.
+
+        The body is assembled from the base64 encoded data directly, so that
+        the encoded data is not copied again when serializing it to JSON.
+        """
+        data = Encoder(data_frame=chunk, dataset_type='multi').encode_bytes
+        index = self.__update_indexes.get(table_name, 0) + index + 1
+        return b''.join(
+            [
+                b'{"tableName":',
+                json_helper.dumps(table_name),
+                b',"index":%d,"data":"' % index,
+                data,
+                b'"}',
+            ]
+        )
+
+    def __upload_chunks(
+        self, table_name: str, pbar, chunksize: int, total: int
+    ) -> bool:
+        """Upload chunks of a table one by one. Return True if all chunks were
+        uploaded successfully."""
+        for index, chunk in enumerate(pbar):
+            response = datasets.upload(
+                connection=self._connection,
+                id=self._id,
+                session_id=self._session_id,
+                body=self.__form_chunk_body(table_name, index, chunk),
+                throw_error=False,
+            )
+            if not response.ok:
+                return False
+            pbar.set_postfix(rows=min((index + 1) * chunksize, total))
+        return True
+
+    def __upload_chunks_async(
+        self, table_name: str, pbar, chunksize: int, total: int
+    ) -> bool:
+        """Upload chunks of a table in parallel. Return True if all chunks were
+        uploaded successfully.
+
+        Chunks are indexed explicitly, so the order in which they reach the
+        I-Server does not matter. Only a limited number of encoded chunks is
+        kept in memory at a time.
+        """
+        threads = helper.get_parallel_number(pbar.total)
+        uploaded = 0
+
+        def collect(future) -> bool:
+            nonlocal uploaded
+            response = future.result()
+            if not response.ok:
+                helper.response_handler(
+                    response,
+                    f"Error uploading data to dataset {self._id}",
+                    throw_error=False,
+                )
+                return False
+            uploaded += 1
+            pbar.set_postfix(rows=min(uploaded * chunksize, total))
+            return True
+
+        failed = False
+        session = self._connection._get_futures_session()
+        pending = deque()
+        try:
+            for index, chunk in enumerate(pbar):
+                pending.append(
+                    datasets.upload_async(
+                        future_session=session,
+                        id=self._id,
+                        session_id=self._session_id,
+                        body=self.__form_chunk_body(table_name, index, chunk),
+                    )
+                )
+                if len(pending) >= 2 * threads:
+                    failed = not collect(pending.popleft())
+                    if failed:
+                        break
+            while pending and not failed:
+                failed = not collect(pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+        return not failed
+
     def save_as(
         self,
         name: str,
@@ -594,14 +664,25 @@ class SuperCube(_Cube, CertifyMixin):
             new_cube.create(folder_id=folder_id)
             return new_cube
 
-    def publish(self) -> bool:
+    def publish(self, timeout: float | None = None) -> bool:
         """Publish the uploaded data to the selected super cube.
 
         Note:
             A super cube can be published just once.
 
+        Args:
+            timeout (float, optional): Maximum time in seconds to wait for the
+                publication to complete. By default (None) waits until it is
+                completed.
+
         Returns:
-            True if the data was published successfully, else False.
+            True if the data was published successfully, False if the
+            publication could not be started.
+
+        Raises:
+            IServerException: If the I-Server reports that publication failed.
+            TimeoutError: If publication was not completed within `timeout`.
+                The publication is cancelled in such case.
         """
         response = datasets.publish(
             connection=self._connection, id=self._id, session_id=self._session_id
@@ -615,17 +696,27 @@ class SuperCube(_Cube, CertifyMixin):
             self.reset_session()
             return False
 
-        status = 6  # default initial status
-        while status != 1:
-            status = self.publish_status()['status']
-            time.sleep(1)
-            if status == 1:
-                # clear instance_id to force new instance creation
-                self.instance_id = None
-                self.reset_session()
-                if config.verbose:
-                    logger.info(f"Super cube '{self.name}' published successfully.")
-                return True
+        try:
+            datasets.wait_for_publish(
+                connection=self._connection,
+                id=self._id,
+                session_id=self._session_id,
+                timeout=timeout,
+            )
+        except TimeoutError:
+            # best effort, the publication may still complete in the meantime
+            datasets.publish_cancel(
+                connection=self._connection, id=self._id, session_id=self._session_id
+            )
+            raise
+        finally:
+            # the upload session cannot be reused after the publication, also
+            # clear instance_id to force new instance creation
+            self.instance_id = None
+            self.reset_session()
+        if config.verbose:
+            logger.info(f"Super cube '{self.name}' published successfully.")
+        return True
 
     def publish_status(self):
         """Check the status of data that was uploaded to a super cube.
@@ -712,7 +803,7 @@ class SuperCube(_Cube, CertifyMixin):
             response = datasets.publish_status(
                 connection=connection, id=id, session_id=session_id
             )
-            return response.json()
+            return json_helper.response_json(response)
 
     @staticmethod
     def __check_param_len(param, msg, max_length):
@@ -362,8 +362,8 @@ class Document(
             return schedules_list_response
         else:
             return [
-                Schedule.from_dict(connection=self.connection, source=schedule_id)
-                for schedule_id in schedules_list_response
+                Schedule.from_dict(connection=self.connection, source=schedule)
+                for schedule in schedules_list_response
             ]
 
     def share_to(self, users: UserOrGroup | list[UserOrGroup]):
@@ -1,6 +1,14 @@
+import heapq
+import logging
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+
+import numpy as np
 import pandas as pd
 import requests
-from packaging import version
 from tqdm.auto import tqdm
 
 from mstrio import config
@@ -8,8 +16,10 @@ from mstrio.api import reports as reports_api
 from mstrio.api.schedules import get_contents_schedule
 from mstrio.connection import Connection
 from mstrio.distribution_services.schedule import Schedule
+from mstrio.helpers import MstrTimeoutError
 from mstrio.object_management.search_operations import SearchPattern, full_search
 from mstrio.users_and_groups.user import User
+from mstrio.utils import json_helper
 from mstrio.utils.cache import CacheSource, ContentCacheMixin
 from mstrio.utils.certified_info import CertifiedInfo
 from mstrio.utils.entity import (
@@ -32,8 +42,10 @@ from mstrio.utils.helper import (
 )
 from mstrio.utils.parser import Parser
 from mstrio.utils.response_processors import objects as objects_processors
-from mstrio.utils.sessions import FuturesSessionWithRenewal
 from mstrio.utils.translation_mixin import TranslationMixin
+from mstrio.utils.version_helper import is_server_min_version
+
+logger = logging.getLogger(__name__)
 
 
 def list_reports(
@@ -185,6 +197,30 @@ class Report(
         'certified_info': CertifiedInfo.from_dict,
     }
     _SIZE_LIMIT = 10000000  # this sets desired chunk size in bytes
+    _LIST_PROPERTIES_ORDER = tuple(
+        sorted(
+            (
+                'id',
+                'instance_id',
+                'type',
+                'subtype',
+                'ext_type',
+                'date_created',
+                'date_modified',
+                'version',
+                'owner',
+                'view_media',
+                'ancestors',
+                'certified_info',
+                'acg',
+                'acl',
+                'attributes',
+                'metrics',
+            ),
+            key=sort_object_properties,
+        )
+    )
+    _LIST_PROPERTIES = frozenset(_LIST_PROPERTIES_ORDER)
 
     _API_PATCH: dict = {
         ('name', 'description', 'abbreviation', 'hidden', 'folder_id'): (
@@ -239,7 +275,9 @@ class Report(
         self._cross_tab_filter = {}
         self._subtotals = {}
         self._dataframe = None
+        self.__dataframe_warned = False
         self._attr_elements = None
+        self._attr_elements_populated = False
 
         self._attributes = []
         self._metrics = []
@@ -261,15 +299,16 @@ class Report(
             abbreviation: new abbreviation of the Report
             hidden: Specifies whether the metric is hidden
         """
-        func = self.alter
-        args = func.__code__.co_varnames[: func.__code__.co_argcount]
-        defaults = func.__defaults__  # type: ignore
-        default_dict = dict(zip(args[-len(defaults) :], defaults)) if defaults else {}
-        local = locals()
-        properties = {}
-        for property_key in default_dict.keys():
-            if local[property_key] is not None:
-                properties[property_key] = local[property_key]
+        properties = {
+            key: value
+            for key, value in (
+                ('name', name),
+                ('description', description),
+                ('abbreviation', abbreviation),
+                ('hidden', hidden),
+            )
+            if value is not None
+        }
         self._alter_properties(**properties)
 
     def to_dataframe(self, limit: int | None = None) -> pd.DataFrame:
@@ -286,6 +325,46 @@ class Report(
         Returns:
             Pandas Data Frame containing the report contents.
         """
+        p, chunks = self.__get_chunks(limit)
+        for values in chunks:
+            p.append(values)
+
+        # return parsed data as a data frame
+        self._dataframe = self.__apply_cross_tab_filter(p.dataframe)
+        return self._dataframe
+
+    def to_dataframe_iter(self, limit: int | None = None) -> Iterator[pd.DataFrame]:
+        """Extract contents of a report instance chunk by chunk, as Pandas
+        `DataFrame` objects, so that the whole report does not have to be kept
+        in memory at once.
+
+        Chunks are yielded in order and concatenated are equal to the result
+        of `to_dataframe()`. They are not stored in `dataframe` property.
+
+        Args:
+            limit (None or int, optional): Used to control data extract
+                behavior. By default (None) the limit is calculated
+                automatically, based on an optimized physical size of one chunk.
+                Setting limit manually will force the number of rows per chunk.
+
+        Yields:
+            Pandas Data Frame containing one chunk of the report contents.
+        """
+        p, chunks = self.__get_chunks(limit)
+        start = 0
+        for values in chunks:
+            chunk = p.to_chunk_dataframe(values)
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield self.__apply_cross_tab_filter(chunk)
+
+    def __get_chunks(self, limit: int | None) -> tuple[Parser, Iterator[tuple]]:
+        """Fetch the first chunk of the report and initialize the parser.
+
+        Returns:
+            Parser and iterator of values extracted from all chunks of
+            the report, in order, including the first one.
+        """
         if limit:
             self._initial_limit = limit
 
@@ -302,155 +381,195 @@ class Report(
                 res = self.__initialize_report(self._initial_limit)
 
         # Gets the pagination totals from the response object
-        _instance = res.json()
+        _instance = json_helper.response_json(res)
+        # size of the decoded body, Content-Length may be the compressed size;
+        # the response itself is not needed anymore and can be released
+        first_chunk_size = len(res.content)
+        del res
         self.instance_id = _instance['instanceId']
         paging = _instance['data']['paging']
 
-        # initialize parser and process first response
+        # initialize parser and process first response; parser only reads
+        # column names and paging info on init, rows are extracted by `extract`
         p = Parser(response=_instance, parse_cube=False)
-        p.parse(response=_instance)
-
-        # If there are more rows to fetch, fetch them
-        if paging['current'] != paging['total']:
-            if not limit:
-                limit = max(
-                    1000,
-                    int((self._initial_limit * self._SIZE_LIMIT) / len(res.content)),
+        first_chunk = p.extract(response=_instance)
+
+        def chunks():
+            yield first_chunk
+            # If there are more rows to fetch, fetch them
+            if paging['current'] != paging['total']:
+                yield from self.__fetch_remaining_chunks(
+                    p, paging, limit, first_chunk_size
                 )
-            # Count the number of additional iterations
-            it_total = int((paging['total'] - self._initial_limit) / limit) + (
-                (paging['total'] - self._initial_limit) % limit != 0
-            )
 
-            if self._parallel and it_total > 1:
-                threads = get_parallel_number(it_total)
-                with FuturesSessionWithRenewal(
-                    connection=self._connection, max_workers=threads
-                ) as session:
-                    fetch_pbar = tqdm(
-                        desc="Downloading",
-                        total=it_total + 1,
-                        disable=(not self._progress_bar),
-                    )
-                    future = self.__fetch_chunks_future(
-                        session, paging, self.instance_id, limit
-                    )
-                    fetch_pbar.update()
-                    for i, f in enumerate(future, start=1):
-                        response = f.result()
-                        if not response.ok:
-                            response_handler(response, "Error getting report contents.")
-                        fetch_pbar.update()
-                        fetch_pbar.set_postfix(
-                            rows=str(
-                                min(self._initial_limit + i * limit, paging['total'])
-                            )
-                        )
-                        p.parse(response.json())
-                    fetch_pbar.close()
-            else:
-                self.__fetch_chunks(p, paging, it_total, self.instance_id, limit)
+        return p, chunks()
 
-        # return parsed data as a data frame
-        self._dataframe = p.dataframe
-
-        # filter dataframe if report had crosstabs and filters were applied
-        if self._cross_tab_filter != {}:
-            if self._cross_tab_filter['metrics'] is not None:
-                # drop metrics columns from dataframe
-                metr_names = [
-                    el['name']
-                    for el in list(
-                        filter(
-                            lambda x: x['id'] not in self._cross_tab_filter['metrics'],
-                            self.metrics,
-                        )
-                    )
-                ]
-                self._dataframe = self._dataframe.drop(metr_names, axis=1)
-
-            if self._cross_tab_filter['attr_elements'] is not None:
-                # create dict of attributes and elements to iterate through
-                attr_dict = {}
-                for attribute in self._cross_tab_filter['attr_elements']:
-                    key = attribute[:32]
-                    attr_dict.setdefault(key, []).append(attribute[33:])
-                # initialize indexes series for filter
-                indexes = pd.Series([False] * len(self._dataframe))
-
-                # logical OR for filtered attribute elements
-                for attribute in attr_dict:
-                    attr_name = list(
-                        filter(
-                            lambda x, attr=attribute: x['id'] in attr, self.attributes
-                        )
-                    )[0]['name']
-                    elements = attr_dict[attribute]
-                    indexes = indexes | self._dataframe[attr_name].isin(elements)
-                # select dataframe indexes with
-                self._dataframe = self._dataframe[indexes]
+    def __apply_cross_tab_filter(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Filter dataframe if report had crosstabs and filters were applied."""
+        if self._cross_tab_filter == {}:
+            return dataframe
 
-            if self._cross_tab_filter['attributes'] is not None:
+        # bind definition once, properties check it on every access
+        attributes, metrics = self.attributes, self.metrics
+
+        if self._cross_tab_filter['metrics'] is not None:
+            # drop metrics columns from dataframe
+            selected = set(self._cross_tab_filter['metrics'])
+            metr_names = [
+                metr['name'] for metr in metrics if metr['id'] not in selected
+            ]
+            dataframe = dataframe.drop(columns=metr_names)
+
+        if self._cross_tab_filter['attr_elements'] is not None:
+            # create dict of attributes and elements to iterate through
+            attr_dict = {}
+            for attribute in self._cross_tab_filter['attr_elements']:
+                key = attribute[:32]
+                attr_dict.setdefault(key, []).append(attribute[33:])
+            id_to_name = {attr['id']: attr['name'] for attr in attributes}
+            # logical OR for filtered attribute elements
+            mask = np.zeros(len(dataframe), dtype=bool)
+            for attr_id, elements in attr_dict.items():
+                column = dataframe[id_to_name[attr_id]]
+                mask |= column.isin(elements).to_numpy()
+            # select dataframe indexes with
+            dataframe = dataframe.iloc[mask]
+
+        if self._cross_tab_filter['attributes'] is not None:
+            selected = set(self._cross_tab_filter['attributes'])
+            attr_names = [
+                attr['name'] for attr in attributes if attr['id'] not in selected
+            ]
+            # filtering out attribute forms columns
+            if attr_names:
+                form_pattern = re.compile(
+                    '^(' + '|'.join(map(re.escape, attr_names)) + ')@'
+                )
+                with_forms, forms = set(), []
+                for column in dataframe.columns:
+                    if match := form_pattern.match(column):
+                        with_forms.add(match.group(1))
+                        forms.append(column)
                 attr_names = [
-                    el['name']
-                    for el in list(
-                        filter(
-                            lambda x: x['id']
-                            not in self._cross_tab_filter['attributes'],
-                            self.attributes,
-                        )
-                    )
-                ]
-                # filtering out attribute forms columns
-                to_be_removed = []
-                to_be_added = []
-                for attr in attr_names:
-                    forms = [
-                        column
-                        for column in self._dataframe.columns
-                        if column.startswith(attr + '@')
-                    ]
-                    if forms:
-                        to_be_removed.append(attr)
-                        to_be_added.extend(forms)
-                for elem in to_be_removed:
-                    attr_names.remove(elem)
-                attr_names.extend(to_be_added)
-                # drop filtered out columns
-                self._dataframe = self._dataframe.drop(attr_names, axis=1)
-        return self._dataframe
+                    attr for attr in attr_names if attr not in with_forms
+                ] + forms
+            # drop filtered out columns
+            dataframe = dataframe.drop(columns=attr_names)
+        return dataframe
+
+    def __fetch_remaining_chunks(
+        self, parser, paging, limit, first_chunk_size
+    ) -> Iterator[tuple]:
+        """Fetch rows following the first chunk of the report. Yield values
+        extracted from the chunks by the parser, in order."""
+        if not limit:
+            limit = max(
+                1000, int((self._initial_limit * self._SIZE_LIMIT) / first_chunk_size)
+            )
+        # Count the number of additional iterations
+        it_total = int((paging['total'] - self._initial_limit) / limit) + (
+            (paging['total'] - self._initial_limit) % limit != 0
+        )
+
+        if self._parallel and it_total > 1:
+            yield from self.__fetch_chunks_future(
+                parser, paging, it_total, self.instance_id, limit
+            )
+        else:
+            yield from self.__fetch_chunks(
+                parser, paging, it_total, self.instance_id, limit
+            )
 
-    def __fetch_chunks_future(self, future_session, pagination, instance_id, limit):
+    def __fetch_chunks_future(self, parser, pagination, it_total, instance_id, limit):
         """Fetch added rows from this object instance from the Intelligence
-        Server."""
-        return [
-            reports_api.report_instance_id_coroutine(
-                future_session,
-                connection=self._connection,
+        Server in parallel.
+
+        Values of each chunk are decoded and extracted by the parser in the
+        thread which downloaded it. They are stored in `chunk_values` attribute
+        of the response and yielded in order of chunks. At most two requests
+        per worker thread are pending at a time, so downloaded chunks do not
+        pile up in memory when they are consumed slowly.
+        """
+
+        def extract(response, *args, **kwargs):
+            if response.ok:
+                response.chunk_values = parser.extract(
+                    json_helper.response_json(response)
+                )
+
+        # request hooks replace those of the session, keep the debug hooks
+        # configured by the connection
+        response_hooks = [*self._connection._session.hooks['response'], extract]
+
+        def submit(offset):
+            return reports_api.report_instance_id_coroutine(
+                session,
                 report_id=self._id,
                 instance_id=instance_id,
-                offset=_offset,
+                offset=offset,
                 limit=limit,
+                hooks={'response': response_hooks},
             )
-            for _offset in range(self._initial_limit, pagination['total'], limit)
-        ]
+
+        session = self._connection._get_futures_session()
+        offsets = iter(range(self._initial_limit, pagination['total'], limit))
+        window = 2 * get_parallel_number(it_total)
+        pending = deque(submit(_offset) for _offset in islice(offsets, window))
+        with tqdm(
+            desc="Downloading", total=it_total + 1, disable=(not self._progress_bar)
+        ) as fetch_pbar:
+            fetch_pbar.update()
+            try:
+                for i in range(1, it_total + 1):
+                    response = pending.popleft().result()
+                    if (_offset := next(offsets, None)) is not None:
+                        pending.append(submit(_offset))
+                    if not response.ok:
+                        response_handler(response, "Error getting report contents.")
+                    fetch_pbar.update()
+                    fetch_pbar.set_postfix(
+                        rows=str(
+                            min(self._initial_limit + i * limit, pagination['total'])
+                        )
+                    )
+                    yield response.chunk_values
+            finally:
+                # on error or when the consumer stops early, do not download
+                # the remaining chunks
+                for future in pending:
+                    future.cancel()
 
     def __fetch_chunks(self, parser, pagination, it_total, instance_id, limit):
         """Fetch added rows from this object instance from the Intelligence
-        Server."""
-        with tqdm(
+        Server.
+
+        Chunks are still requested one at a time, but the next chunk is
+        downloaded and extracted in a background thread while values of the
+        current one are consumed. Values are yielded in order of chunks.
+        """
+
+        def fetch(offset):
+            response = self.__get_chunk(
+                instance_id=instance_id, offset=offset, limit=limit
+            )
+            return parser.extract(json_helper.response_json(response))
+
+        with ThreadPoolExecutor(max_workers=1) as executor, tqdm(
             desc="Downloading", total=it_total + 1, disable=(not self._progress_bar)
         ) as fetch_pbar:
             fetch_pbar.update()
-            for _offset in range(self._initial_limit, pagination['total'], limit):
-                response = self.__get_chunk(
-                    instance_id=instance_id, offset=_offset, limit=limit
-                )
+            offsets = range(self._initial_limit, pagination['total'], limit)
+            future = executor.submit(fetch, offsets[0]) if offsets else None
+            for i, _offset in enumerate(offsets, start=1):
+                values = future.result()
+                # request the next chunk before the current one is consumed
+                if i < len(offsets):
+                    future = executor.submit(fetch, offsets[i])
                 fetch_pbar.update()
                 fetch_pbar.set_postfix(
                     rows=str(min(_offset + limit, pagination['total']))
                 )
-                parser.parse(response=response.json())
+                yield values
 
     def __initialize_report(self, limit: int) -> requests.Response:
         inst_pbar = tqdm(
@@ -463,9 +582,7 @@ class Report(
 
         # Switch off subtotals if I-Server version is higher than 11.2.1
         body = self._filter._request_body()
-        if version.parse(self._connection.iserver_version) >= version.parse(
-            "11.2.0100"
-        ):
+        if is_server_min_version(self._connection, "11.2.0100"):
             self._subtotals["visible"] = False
             body["subtotals"] = {"visible": self._subtotals["visible"]}
 
@@ -567,6 +684,8 @@ class Report(
 
         Implements GET /v2/reports/<report_id>.
         """
+        if self.__definition_retrieved:
+            return
         response = reports_api.report_definition(
             connection=self._connection, report_id=self._id
         ).json()
@@ -574,9 +693,7 @@ class Report(
         grid = response["definition"]["grid"]
         available_objects = response['definition']['availableObjects']
 
-        if version.parse(self._connection.iserver_version) >= version.parse(
-            "11.2.0100"
-        ):
+        if is_server_min_version(self._connection, "11.2.0100"):
             self._subtotals = grid["subtotals"]
         self.name = response["name"]
         self._cross_tab = grid["crossTab"]
@@ -623,43 +740,6 @@ class Report(
 
         Implements GET /reports/<report_id>/attributes/<attribute_id>/elements.
         """
-
-        def fetch_for_attribute(attribute):
-            @fallback_on_timeout()
-            def fetch_for_attribute_given_limit(limit):
-                response = reports_api.report_single_attribute_elements(
-                    connection=self._connection,
-                    report_id=self._id,
-                    attribute_id=attribute['id'],
-                    offset=0,
-                    limit=limit,
-                )
-                # Get total number of rows from headers.
-                total = int(response.headers['x-mstr-total-count'])
-                # Get attribute elements from the response.
-                elements = response.json()
-
-                # If total number of elements is bigger than the chunk size
-                # (limit), fetch them incrementally.
-                for _offset in range(limit, total, limit):
-                    response = reports_api.report_single_attribute_elements(
-                        connection=self._connection,
-                        report_id=self._id,
-                        attribute_id=attribute['id'],
-                        offset=_offset,
-                        limit=limit,
-                    )
-                    elements.extend(response.json())
-
-                # Return attribute data.
-                return {
-                    "attribute_name": attribute['name'],
-                    "attribute_id": attribute['id'],
-                    "elements": elements,
-                }
-
-            return fetch_for_attribute_given_limit(limit)[0]
-
         attr_elements = []
         if self.attributes:
             pbar = tqdm(
@@ -668,68 +748,168 @@ class Report(
                 leave=False,
                 disable=(not self._progress_bar),
             )
-            attr_elements = [fetch_for_attribute(attribute) for attribute in pbar]
+            attr_elements = [
+                self.__get_single_attr_elements(attribute, limit) for attribute in pbar
+            ]
             pbar.close()
 
         return attr_elements
 
-    def __get_attr_elements_async(self, limit: int = 50000) -> list:
+    def __get_single_attr_elements(self, attribute: dict, limit: int) -> dict:
+        """Get elements of a single report attribute synchronously. On timeout
+        the elements are requested again with halved `limit`."""
+
+        @fallback_on_timeout()
+        def fetch_for_attribute_given_limit(limit):
+            response = reports_api.report_single_attribute_elements(
+                connection=self._connection,
+                report_id=self._id,
+                attribute_id=attribute['id'],
+                offset=0,
+                limit=limit,
+            )
+            # Get total number of rows from headers.
+            total = int(response.headers['x-mstr-total-count'])
+            # Get attribute elements from the response into a list allocated
+            # for all elements at once.
+            chunk = response.json()
+            elements = [None] * max(total, len(chunk))
+            elements[: len(chunk)] = chunk
+            filled = len(chunk)
+
+            # If total number of elements is bigger than the chunk size
+            # (limit), fetch them incrementally.
+            for _offset in range(limit, total, limit):
+                response = reports_api.report_single_attribute_elements(
+                    connection=self._connection,
+                    report_id=self._id,
+                    attribute_id=attribute['id'],
+                    offset=_offset,
+                    limit=limit,
+                )
+                chunk = response.json()
+                elements[filled : filled + len(chunk)] = chunk
+                filled += len(chunk)
+            # drop unfilled slots if server returned fewer elements
+            del elements[filled:]
+
+            # Return attribute data.
+            return {
+                "attribute_name": attribute['name'],
+                "attribute_id": attribute['id'],
+                "elements": elements,
+            }
+
+        return fetch_for_attribute_given_limit(limit)[0]
+
+    def __get_attr_elements_async(self, limit: int = 5000) -> list:
         """Get elements of report attributes asynchronously.
 
+        First chunks of elements of all attributes are requested at once.
+        Remaining chunks are requested as soon as the total number of elements
+        of the attribute is known, so they are downloaded concurrently too.
+        Number of requests in flight is bounded by the workers of the futures
+        session of the connection, so chunks are kept small: they are less
+        likely to time out and are downloaded in parallel anyway.
+
+        If a request for elements of an attribute times out, only elements of
+        that attribute are requested again, synchronously with smaller chunks.
+
         Implements GET /reports/<report_id>/attributes/<attribute_id>/elements.
         """
 
         attr_elements = []
         if self.attributes:
-            threads = get_parallel_number(len(self.attributes))
-            with FuturesSessionWithRenewal(
-                connection=self._connection, max_workers=threads
-            ) as session:
-                # Fetch first chunk of attribute elements.
-                futures = self.__fetch_attribute_elements_chunks(session, limit)
-                pbar = tqdm(
-                    futures,
-                    desc="Loading attribute elements",
-                    leave=False,
-                    disable=(not self._progress_bar),
-                )
-                for i, future in enumerate(pbar):
-                    attr = self.attributes[i]
-                    response = future.result()
-                    if not response.ok:
-                        response_handler(
-                            response, f"Error getting attribute {attr['name']} elements"
-                        )
-                    elements = response.json()
+            session = self._connection._get_futures_session()
+            # Fetch first chunk of attribute elements.
+            futures = self.__fetch_attribute_elements_chunks(session, limit)
+            chunks = []
+            try:
+                for attr, future in zip(self.attributes, futures):
+                    try:
+                        response = self.__attr_elements_result(attr, future)
+                    except MstrTimeoutError:
+                        # attribute will be fetched again using fallback
+                        chunks.append(None)
+                        continue
                     # Get total number of rows from headers.
                     total = int(response.headers['x-mstr-total-count'])
-                    for _offset in range(limit, total, limit):
-                        response = reports_api.report_single_attribute_elements(
-                            connection=self._connection,
-                            report_id=self._id,
-                            attribute_id=attr["id"],
-                            offset=_offset,
-                            limit=limit,
-                        )
-                        elements.extend(response.json())
-                    # Append attribute data to the list of attributes.
-                    attr_elements.append(
-                        {
-                            "attribute_name": attr['name'],
-                            "attribute_id": attr['id'],
-                            "elements": elements,
-                        }
+                    chunks.append(
+                        [future]
+                        + [
+                            reports_api.report_single_attribute_elements_coroutine(
+                                session,
+                                report_id=self._id,
+                                attribute_id=attr['id'],
+                                offset=_offset,
+                                limit=limit,
+                            )
+                            for _offset in range(limit, total, limit)
+                        ]
                     )
-                pbar.close()
 
-            return attr_elements
+                with tqdm(
+                    chunks,
+                    desc="Loading attribute elements",
+                    leave=False,
+                    disable=(not self._progress_bar),
+                ) as pbar:
+                    attr_elements = [
+                        self.__collect_attr_elements(attr, attr_chunks, limit)
+                        for attr, attr_chunks in zip(self.attributes, pbar)
+                    ]
+            except Exception:
+                # do not leave requests for elements of the remaining
+                # attributes running in the futures session of the connection
+                for future in chain(futures, *filter(None, chunks)):
+                    future.cancel()
+                raise
+
+        return attr_elements
+
+    def __collect_attr_elements(
+        self, attr: dict, attr_chunks: list | None, limit: int
+    ) -> dict:
+        """Collect elements of an attribute from futures of its chunks. If any
+        of them timed out (or `attr_chunks` is None as the first one did),
+        elements are fetched synchronously with halved `limit` instead."""
+        elements = []
+        for future in attr_chunks or ():
+            try:
+                response = self.__attr_elements_result(attr, future)
+            except MstrTimeoutError:
+                for pending in attr_chunks:
+                    pending.cancel()
+                attr_chunks = None
+                break
+            elements.extend(response.json())
+
+        if attr_chunks is None:
+            logger.warning(
+                f"Timeout hit when loading elements of attribute {attr['name']} "
+                f"with limit {limit}, retrying with limit {limit // 2}"
+            )
+            return self.__get_single_attr_elements(attr, limit // 2)
+        return {
+            "attribute_name": attr['name'],
+            "attribute_id": attr['id'],
+            "elements": elements,
+        }
+
+    @staticmethod
+    def __attr_elements_result(attr: dict, future) -> requests.Response:
+        response = future.result()
+        if not response.ok:
+            response_handler(
+                response, f"Error getting attribute {attr['name']} elements"
+            )
+        return response
 
     def __fetch_attribute_elements_chunks(self, future_session, limit: int) -> list:
         # Fetch add'l rows from this object instance
         return [
             reports_api.report_single_attribute_elements_coroutine(
                 future_session,
-                connection=self._connection,
                 report_id=self._id,
                 attribute_id=attribute['id'],
                 offset=0,
@@ -741,31 +921,21 @@ class Report(
     def list_properties(self):
         """List all properties of the object."""
 
-        attributes = {
-            key: self.__dict__[key] for key in self.__dict__ if not key.startswith('_')
-        }
-        attributes = {
-            **attributes,
-            "id": self.id,
-            "instance_id": self.instance_id,
-            "type": self.type,
-            "subtype": self.subtype,
-            "ext_type": self.ext_type,
-            "date_created": self.date_created,
-            "date_modified": self.date_modified,
-            "version": self.version,
-            "owner": self.owner,
-            "view_media": self.view_media,
-            "ancestors": self.ancestors,
-            "certified_info": self.certified_info,
-            "acg": self.acg,
-            "acl": self.acl,
-            "attributes": self.attributes,
-            "metrics": self.metrics,
+        public = {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.startswith('_') and key not in self._LIST_PROPERTIES
         }
+        properties = {key: getattr(self, key) for key in self._LIST_PROPERTIES_ORDER}
+        # only the few instance attributes have to be sorted, fixed properties
+        # are already in order, so both sequences are just merged
         return {
-            key: attributes[key]
-            for key in sorted(attributes, key=sort_object_properties)
+            key: public[key] if key in public else properties[key]
+            for key in heapq.merge(
+                sorted(public, key=sort_object_properties),
+                self._LIST_PROPERTIES_ORDER,
+                key=sort_object_properties,
+            )
         }
 
     def list_available_schedules(
@@ -793,8 +963,8 @@ class Report(
         if to_dictionary:
             return schedules_list_response
         return [
-            Schedule.from_dict(connection=self.connection, source=schedule_id)
-            for schedule_id in schedules_list_response
+            Schedule.from_dict(connection=self.connection, source=schedule)
+            for schedule in schedules_list_response
         ]
 
     @property
@@ -813,16 +983,15 @@ class Report(
     def attr_elements(self):
         if not self.__definition_retrieved:
             self._get_definition()
-        if not self._attr_elements and self._id:
+        # checked with a flag, as an empty list of elements is a valid result
+        # which must not trigger fetching and populating the filter again
+        if not self._attr_elements_populated and self._id:
             if self._parallel is True:
-                # TODO: move the fallback inside the function to apply
-                # per-attribute, like with non-async version.
-                self._attr_elements = fallback_on_timeout()(
-                    self.__get_attr_elements_async
-                )(50000)[0]
+                self._attr_elements = self.__get_attr_elements_async(5000)
             else:
                 self._attr_elements = self.__get_attr_elements()
             self._filter._populate_attr_elements(self._attr_elements)
+            self._attr_elements_populated = True
         return self._attr_elements
 
     @property
@@ -854,9 +1023,11 @@ class Report(
 
     @property
     def dataframe(self) -> pd.DataFrame:
-        if self._dataframe is None:
+        # warn only once, the property may be polled until data is loaded
+        if self._dataframe is None and not self.__dataframe_warned:
             exception_handler(
                 msg="Dataframe not loaded. Retrieve with Report.to_dataframe().",
                 exception_type=Warning,
             )
+            self.__dataframe_warned = True
         return self._dataframe
@@ -1,7 +1,7 @@
 # flake8: noqa
 from typing import Union
 
-from .user import User, create_users_from_csv, list_users
+from .user import User, create_users_from_csv, iter_users, list_users
 from .user_connections import UserConnections
 from .user_group import UserGroup, list_user_groups
 
@@ -1,5 +1,6 @@
 import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum, IntFlag
 from typing import TYPE_CHECKING, Optional
@@ -85,6 +86,53 @@ def list_users(
     )
 
 
+def iter_users(
+    connection: Connection,
+    name_begins: str | None = None,
+    abbreviation_begins: str | None = None,
+    to_dictionary: bool = False,
+    limit: int | None = None,
+    **filters,
+) -> Iterator["User"] | Iterator[dict]:
+    """Iterate over user objects or user dicts. Works like `list_users`, but
+    users are downloaded in chunks while they are iterated over, so the first
+    users are available before all of them are downloaded and only a few
+    chunks are kept in memory at once.
+
+    Args:
+        connection: MicroStrategy connection object returned by
+            `connection.Connection()`
+        name_begins: characters that the user name must begin with.
+        abbreviation_begins: characters that the abbreviation must begin with.
+        to_dictionary: If True yields dicts, by default (False) yields
+            User objects.
+        limit: limit the number of elements returned. If `None` (default), all
+            objects are returned.
+        **filters: Available filter parameters: ['id', 'name', 'abbreviation',
+            'description', 'type', 'subtype', 'date_created', 'date_modified',
+            'version', 'acg', 'icon_path', 'owner', 'initials']
+
+    Examples:
+        >>> for user in iter_users(connection, name_begins='user'):
+        ...     print(user.name)
+    """
+    objects = users.iter_all(
+        connection=connection,
+        limit=limit,
+        msg="Error getting information for a set of users.",
+        name_begins=name_begins,
+        abbreviation_begins=abbreviation_begins,
+        filters=filters,
+    )
+    if to_dictionary:
+        return objects
+    # keys are already converted to snake case by `users.iter_all`
+    return (
+        User.from_dict(source=obj, connection=connection, to_snake_case=False)
+        for obj in objects
+    )
+
+
 class User(Entity, DeleteMixin, TrusteeACLMixin, TranslationMixin):
     """Object representation of MicroStrategy User object.
 
@@ -372,7 +420,11 @@ class User(Entity, DeleteMixin, TrusteeACLMixin, TranslationMixin):
         if to_dictionary:
             return objects
         else:
-            return [cls.from_dict(source=obj, connection=connection) for obj in objects]
+            # keys are already converted to snake case by `users.get_all`
+            return [
+                cls.from_dict(source=obj, connection=connection, to_snake_case=False)
+                for obj in objects
+            ]
 
     @classmethod
     def _get_user_ids(
@@ -447,7 +499,7 @@ class User(Entity, DeleteMixin, TrusteeACLMixin, TranslationMixin):
             "value": address,
             "default": default,
         }
-        users.create_address(self.connection, self.id, body)
+        users.create_address(self.connection, self.id, body, parse_response=False)
         response = users.get_addresses(self.connection, self.id)
         return response
 
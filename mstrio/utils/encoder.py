@@ -48,13 +48,19 @@ class Encoder:
     @property
     def encode(self):
         """Encode data in base 64."""
+        self.__b64_data = self.encode_bytes.decode('ascii')
+        # return base 64 encoded data to calling environment
+        return self.__b64_data
+
+    @property
+    def encode_bytes(self) -> bytes:
+        """Encode data in base 64 and return it as bytes, without creating
+        an additional string copy of the encoded data."""
         for col in self.__data_frame:
-            if isinstance(self.__data_frame[col][0], dt.date):
+            if isinstance(self.__data_frame[col].iloc[0], dt.date):
                 self.__data_frame[col] = self.__data_frame[col].astype('str')
-        self.__b64_data = b64encode(
+        return b64encode(
             self.__data_frame.to_json(
                 orient=self.__orientation, date_format='iso'
             ).encode('utf-8')
-        ).decode('utf-8')
-        # return base 64 encoded data to calling environment
-        return self.__b64_data
+        )
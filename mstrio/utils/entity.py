@@ -4,6 +4,7 @@ import inspect
 import logging
 from collections.abc import Callable
 from enum import Enum
+from functools import cache
 from os.path import join as joinpath
 from pprint import pprint
 from sys import version_info
@@ -37,6 +38,13 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+@cache
+def _supported_subtype_values(cls: type) -> frozenset[int]:
+    # `_OBJECT_SUBTYPES` are fixed per class, so their values are collected
+    # only once for every class
+    return frozenset(item.value for item in cls._OBJECT_SUBTYPES)
+
+
 class EntityBase(helper.Dictable):
     """This class is for objects that do not have a specified MSTR type.
 
@@ -287,7 +295,7 @@ class EntityBase(helper.Dictable):
             True if subtype is supported by class.
             False if subtype is not supported.
         """
-        return subtype in [item.value for item in cls._OBJECT_SUBTYPES]
+        return subtype in _supported_subtype_values(cls)
 
     def _add_missing_attributes(self, key, json) -> None:
         # Set the keys that are missing in the response to None
@@ -8,7 +8,11 @@ class AutoName(Enum):
 
     @classmethod
     def has_value(cls, value):
-        return value in {item.value for item in cls}
+        try:
+            return value in cls._value2member_map_
+        except TypeError:
+            # unhashable values can't be members of the lookup table
+            return False
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -58,6 +62,10 @@ def validate_enum_value(obj, enum):
     """
     from mstrio.utils.helper import exception_handler
 
+    # fast path: lookup table of a single enum is keyed by member values
+    if not isinstance(enum, tuple) and obj in enum._value2member_map_:
+        return
+
     possible_values = (
         [[e.value for e in item] for item in enum]
         if isinstance(enum, tuple)
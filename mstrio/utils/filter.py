@@ -165,7 +165,7 @@ class Filter:
 
         if object_id in self.attributes:
             return "attribute"
-        elif object_id in list(self.metrics) + self.row_count_metrics:
+        elif object_id in self.metrics or object_id in self.row_count_metrics:
             return "metric"
         elif object_id in self.attr_elems:
             return "element"
@@ -176,20 +176,18 @@ class Filter:
         """Check if requested object_id is a valid object id."""
         object_is_attr_el = ':' in object_id
         if object_is_attr_el:
-            return object_id.split(':')[0] not in self.attributes.keys()
+            return object_id.split(':')[0] not in self.attributes
         else:
-            valid_object_ids = (
-                list(self.metrics.keys())
-                + list(self.attributes.keys())
-                + self.row_count_metrics
+            return not (
+                object_id in self.metrics
+                or object_id in self.attributes
+                or object_id in self.row_count_metrics
             )
-            return object_id not in valid_object_ids
 
     def __duplicated(self, object_id):
         """Check if requested object_id is already selected."""
-        attr_selected = [elem[0] for elem in self.attr_selected]
-        all_selected_objects = (
-            attr_selected + self.metr_selected + self.attr_elem_selected
+        return (
+            any(elem[0] == object_id for elem in self.attr_selected)
+            or object_id in self.metr_selected
+            or object_id in self.attr_elem_selected
         )
-
-        return object_id in all_selected_objects
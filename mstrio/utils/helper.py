@@ -3,12 +3,17 @@ import logging
 import math
 import os
 import re
+import threading
 import time
 import warnings
-from collections.abc import Callable
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from copy import deepcopy
 from datetime import datetime
 from enum import Enum
 from functools import reduce, wraps
+from itertools import islice
 from json.decoder import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -22,9 +27,9 @@ from mstrio.helpers import (
     VersionException,
 )
 from mstrio.types import ObjectSubTypes
+from mstrio.utils import json_helper
 from mstrio.utils.dict_filter import filter_list_of_dicts
 from mstrio.utils.enum_helper import get_enum_val
-from mstrio.utils.sessions import FuturesSessionWithRenewal
 from mstrio.utils.time_helper import (
     DatetimeFormats,
     map_datetime_to_str,
@@ -307,6 +312,74 @@ def fallback_on_timeout(min_limit: int = 50):
     return decorate
 
 
+def cache_per_connection(
+    maxsize: int = 512, ttl: float | None = None, cache_empty: bool = True
+):
+    """Return a decorator, which memoizes results of a function fetching
+    read-only metadata. The first argument of the decorated function has to be
+    a connection object. Results are cached separately for every connection
+    and are dropped together with it. Calls with unhashable arguments are not
+    cached. Every call returns a copy of the cached result, so it can be
+    freely modified by the caller.
+
+    The decorated function gets a `cache_clear(connection=None)` method, which
+    clears results cached for the given connection or for all of them.
+
+    Args:
+        maxsize: The maximum number of results cached for a single connection.
+            The least recently used results are discarded first.
+        ttl: Time in seconds after which a cached result expires. By default
+            results do not expire.
+        cache_empty: If False, empty results are not cached, so objects
+            created after such a call are found by the next one.
+    """
+
+    def decorate(func: Callable):
+        """Replaces `cpc_wrapper`'s __name__, __doc__ and __module__ with those
+        of `func`."""
+        caches = weakref.WeakKeyDictionary()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def cpc_wrapper(connection: "Connection", *args, **kwargs):
+            key = (args, frozenset(kwargs.items()))
+            try:
+                hash(key)
+            except TypeError:
+                return func(connection, *args, **kwargs)
+
+            with lock:
+                cache = caches.setdefault(connection, OrderedDict())
+                if key in cache:
+                    cached_at, result = cache[key]
+                    if ttl is None or time.monotonic() - cached_at < ttl:
+                        cache.move_to_end(key)
+                        return deepcopy(result)
+                    del cache[key]
+
+            result = func(connection, *args, **kwargs)
+            if not cache_empty and not result:
+                return result
+            with lock:
+                cache[key] = time.monotonic(), result
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return deepcopy(result)
+
+        def cache_clear(connection: "Connection | None" = None) -> None:
+            with lock:
+                if connection is None:
+                    caches.clear()
+                else:
+                    caches.pop(connection, None)
+
+        cpc_wrapper.cache_clear = cache_clear
+        return cpc_wrapper
+
+    return decorate
+
+
 def get_parallel_number(total_chunks):
     """Returns the optimal number of threads to be used for downloading
     cubes/reports in parallel."""
@@ -360,10 +433,41 @@ def fetch_objects_async(
         kwargs: all specific parameters that the api methods require that need
             to be additionally specified
     """
+    all_objects = []
+    for objects in iter_objects_async(
+        connection=connection,
+        api=api,
+        async_api=async_api,
+        limit=limit,
+        chunk_size=chunk_size,
+        filters=filters,
+        error_msg=error_msg,
+        dict_unpack_value=dict_unpack_value,
+        **kwargs,
+    ):
+        all_objects.extend(objects)
+    return all_objects
+
+
+def iter_objects_async(
+    connection: "Connection",
+    api: Callable,
+    async_api: Callable,
+    limit: int | None,
+    chunk_size: int,
+    filters: dict,
+    error_msg: str | None = None,
+    dict_unpack_value: str | None = None,
+    **kwargs,
+) -> Iterator[list]:
+    """Yield chunks of objects, in order, as soon as they are downloaded.
+    Remaining chunks are requested asynchronously, at most a few of them
+    ahead of the consumer, so only these chunks are kept in memory at once.
+    Arguments are the same as of `fetch_objects_async`.
+    """
     validate_param_value('limit', limit, int, min_val=1, special_values=[None])
     offset = 0
     chunk_size = min(limit, chunk_size) if limit else chunk_size
-    all_objects = []
 
     # Extract parameters of the api wrapper and set them using the kwargs
     args = get_args_from_func(api)
@@ -379,47 +483,59 @@ def fetch_objects_async(
         error_msg=error_msg,
         **param_value_dict,
     )
-    objects = _prepare_objects(response.json(), filters, dict_unpack_value)
-    all_objects.extend(objects)
     current_count = offset + chunk_size
     total_objects = int(response.headers.get('x-mstr-total-count'))
     total_objects = min(limit, total_objects) if limit else total_objects
+    yield _prepare_objects(
+        json_helper.response_json(response), filters, dict_unpack_value
+    )
 
     if total_objects > current_count:
-        it_total = math.ceil(total_objects / chunk_size)
-        threads = get_parallel_number(it_total)
-        with FuturesSessionWithRenewal(
-            connection=connection, max_workers=threads
-        ) as session:
-            # Extract parameters of the api wrapper and set them using kwargs
-            param_value_dict = auto_match_args(
-                api,
-                kwargs,
-                exclude=[
-                    'connection',
-                    'limit',
-                    'offset',
-                    'future_session',
-                    'error_msg',
-                ],
+        # the futures session shared by the connection reuses its worker
+        # threads and the pooled connections of the underlying session
+        session = connection._get_futures_session()
+        # Extract parameters of the api wrapper and set them using kwargs
+        param_value_dict = auto_match_args(
+            api,
+            kwargs,
+            exclude=['connection', 'limit', 'offset', 'future_session', 'error_msg'],
+        )
+        offsets = iter(range(current_count, total_objects, chunk_size))
+        window = 2 * get_parallel_number(
+            math.ceil((total_objects - current_count) / chunk_size)
+        )
+        # keep the workers busy with the next chunks while the consumer
+        # processes the current one, without requesting all of them at once
+        futures = deque(
+            async_api(
+                future_session=session,
+                offset=_offset,
+                limit=chunk_size,
+                **param_value_dict,
             )
-            futures = [
-                async_api(
-                    future_session=session,
-                    offset=offset,
-                    limit=chunk_size,
-                    **param_value_dict,
+            for _offset in islice(offsets, window)
+        )
+        try:
+            while futures:
+                response = futures.popleft().result()
+                for _offset in islice(offsets, 1):
+                    futures.append(
+                        async_api(
+                            future_session=session,
+                            offset=_offset,
+                            limit=chunk_size,
+                            **param_value_dict,
+                        )
+                    )
+                if not response.ok:
+                    response_handler(response, error_msg, throw_error=False)
+                yield _prepare_objects(
+                    json_helper.response_json(response), filters, dict_unpack_value
                 )
-                for offset in range(current_count, total_objects, chunk_size)
-            ]
-
-        for f in futures:
-            response = f.result()
-            if not response.ok:
-                response_handler(response, error_msg, throw_error=False)
-            objects = _prepare_objects(response.json(), filters, dict_unpack_value)
-            all_objects.extend(objects)
-    return all_objects
+        finally:
+            # consumer stopped early or an error occurred
+            for future in futures:
+                future.cancel()
 
 
 def fetch_objects(
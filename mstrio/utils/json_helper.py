@@ -0,0 +1,57 @@
+import json
+import math
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency, standard library is used instead
+    orjson = None
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize `obj` to compact JSON encoded bytes. Uses `orjson` when it is
+    installed, which is considerably faster for large payloads.
+
+    NaN and infinite floats, which JSON cannot represent, are written as
+    `null` by both implementations, so the result does not depend on whether
+    `orjson` is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    kwargs = {'allow_nan': False, 'ensure_ascii': False, 'separators': (',', ':')}
+    try:
+        serialized = json.dumps(obj, **kwargs)
+    except ValueError as err:
+        if 'out of range float' not in str(err).lower():
+            raise
+        # payloads with non-finite floats are rare, so they are replaced only
+        # after the first attempt fails
+        serialized = json.dumps(_replace_non_finite(obj), **kwargs)
+    return serialized.encode('utf-8')
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON document from bytes or string. Uses `orjson` when it
+    is installed, which is considerably faster for large payloads."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response: 'Response') -> Any:
+    """Deserialize body of the `response`, equivalent to `response.json()`.
+    The raw body is decoded directly, without creating an intermediate
+    string."""
+    return loads(response.content)
@@ -1,5 +1,3 @@
-from itertools import chain
-
 import numpy as np
 import pandas as pd
 
@@ -37,56 +35,95 @@ class Parser:
 
         self.__extract_paging_info(response)
 
-        # attribute data
-        self._mapped_attributes = np.zeros(
-            (0, len(self._attribute_col_names)), dtype=object
-        )
+        # attribute data, kept as a list of per-response arrays which are
+        # stacked once when the data frame is built
+        self._mapped_attributes = []
 
     def parse(self, response):
         """
         Args:
             response: JSON-formatted content of API response.
         """
+        self.append(self.extract(response))
+
+    def extract(self, response):
+        """Extract attribute and metric values from a single response without
+        modifying the state of the parser, so it can be called from multiple
+        threads. Extracted values have to be passed to `append()` in the order
+        of responses.
+
+        Args:
+            response: JSON-formatted content of API response.
+        """
+        attributes, metrics = None, None
         if self.total_rows > 0:
             # extract attribute values into numpy 2D array if attributes exist
             # in the response
             if self._attribute_names:
-                self._mapped_attributes = np.vstack(
-                    (self._mapped_attributes, self.__map_attributes(response=response))
-                )
+                attributes = self.__map_attributes(response=response)
 
             # extract metric values if metrics exist in the response
             if self._metric_col_names:
-                self._metric_values_raw.extend(
-                    self.__extract_metric_values(response=response)
-                )
+                metrics = self.__extract_metric_values(response=response)
+        return attributes, metrics
+
+    def append(self, extracted):
+        """Append values returned by `extract()` to the parsed data.
+
+        Args:
+            extracted: tuple of attribute and metric values of a response.
+        """
+        attributes, metrics = extracted
+        if attributes is not None:
+            self._mapped_attributes.append(attributes)
+        if metrics is not None:
+            self._metric_values_raw.extend(metrics)
+
+    def to_chunk_dataframe(self, extracted):
+        """Convert values returned by `extract()` into a data frame with the
+        same columns as `dataframe`, without appending them to parsed data.
+
+        Args:
+            extracted: tuple of attribute and metric values of a response.
+        """
+        attributes, metrics = extracted
+        if attributes is None:
+            attributes = np.zeros((0, len(self._attribute_col_names)), dtype=object)
+        return self.__build_dataframe(attributes, metrics or [])
 
     def __to_dataframe(self):
+        mapped_attributes = np.zeros((0, len(self._attribute_col_names)), dtype=object)
+        if self._mapped_attributes:
+            mapped_attributes = np.vstack(self._mapped_attributes)
+            self._mapped_attributes = [mapped_attributes]
+        return self.__build_dataframe(mapped_attributes, self._metric_values_raw)
+
+    def __build_dataframe(self, mapped_attributes, metric_values_raw):
         # create attribute data frame, then re-map integer array with
         # corresponding attribute element values
         attribute_df = pd.DataFrame(
-            data=self._mapped_attributes, columns=self._attribute_col_names
+            data=mapped_attributes, columns=self._attribute_col_names
         )
 
         # create metric values data frame
-        metric_df = pd.DataFrame(
-            data=self._metric_values_raw, columns=self._metric_col_names
-        )
+        metric_df = pd.DataFrame(data=metric_values_raw, columns=self._metric_col_names)
 
         return pd.concat([attribute_df, metric_df], axis=1)
 
     def __map_attributes(self, response):
         label_map = self.__create_attribute_element_map(response=response)
-        row_index = self.__extract_attribute_element_row_index(response=response)
-        row_index_array = np.array(row_index)
-        _, columns = row_index_array.shape
+        row_index_array = self.__extract_attribute_element_row_index(response)
+        rows, columns = row_index_array.shape
 
-        # create attribute form name to attribute form index mapping
-        vfunc = np.vectorize(
-            lambda attribute_indexes, columns: label_map[columns][attribute_indexes]
-        )
+        # map attribute element indexes to their labels column by column with
+        # array indexing, instead of calling a Python function for every cell
+        mapped = np.empty((rows, columns), dtype=object)
+        for column in range(columns):
+            labels = np.empty(len(label_map[column]), dtype=object)
+            labels[:] = label_map[column]
+            mapped[:, column] = labels[row_index_array[:, column]]
 
-        return vfunc(row_index_array, range(columns))
+        return mapped
 
     def __create_attribute_element_map(self, response):
         """Create a map of type nested list for attribute element labels.
@@ -141,18 +178,11 @@ class Parser:
         return ae_index_map
 
     def __extract_attribute_element_row_index(self, response):
-        # extracts the attribute element row index from the headers
-        return [
-            list(
-                chain.from_iterable(
-                    [
-                        [r for _ in f]
-                        for r, f in zip(row, self._attribute_elem_form_names)
-                    ]
-                )
-            )
-            for row in response["data"]["headers"]["rows"]
-        ]
+        # extracts the attribute element row index from the headers and
+        # repeats the index of every attribute for each of its forms
+        forms_count = [len(forms) for forms in self._attribute_elem_form_names]
+        row_index = np.array(response["data"]["headers"]["rows"], dtype=int)
+        return np.repeat(row_index.reshape(-1, len(forms_count)), forms_count, axis=1)
 
     def __extract_paging_info(self, response):
         # extract paging info
@@ -1,6 +1,44 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import as_completed
+
 from mstrio.api import users as users_api
 from mstrio.connection import Connection
-from mstrio.utils.helper import fetch_objects_async
+from mstrio.utils import json_helper
+from mstrio.utils.helper import (
+    fetch_objects_async,
+    iter_objects_async,
+    response_handler,
+)
+
+
+def _get_many(
+    connection: Connection, async_api: Callable, ids: list[str], msg: str, **kwargs
+) -> list:
+    """Call `async_api` for each of the user `ids` concurrently using futures
+    session shared by the connection, which bounds the number of requests in
+    flight by its number of workers.
+
+    Returns:
+        list of deserialized responses in order of `ids`
+    """
+    session = connection._get_futures_session()
+    futures = {
+        async_api(future_session=session, id=id, **kwargs): index
+        for index, id in enumerate(ids)
+    }
+    results = [None] * len(futures)
+    try:
+        for future in as_completed(futures):
+            index = futures[future]
+            response = future.result()
+            if not response.ok:
+                response_handler(response, msg.format(id=ids[index]))
+            results[index] = json_helper.response_json(response)
+    finally:
+        # on error, do not send requests which are still queued
+        for future in futures:
+            future.cancel()
+    return results
 
 
 def get(connection: Connection, id: str):
@@ -13,7 +51,27 @@ def get(connection: Connection, id: str):
     Returns:
         dict representing user object
     """
-    return users_api.get_user_info(connection=connection, id=id).json()
+    return json_helper.response_json(
+        users_api.get_user_info(connection=connection, id=id)
+    )
+
+
+def get_many(connection: Connection, ids: list[str]):
+    """Get users by specified IDs. Requests are sent concurrently.
+
+    Args:
+        connection: MicroStrategy REST API connection object
+        ids: IDs of the users
+
+    Returns:
+        list of dicts representing user objects in order of `ids`
+    """
+    return _get_many(
+        connection,
+        users_api.get_user_info_async,
+        ids,
+        msg="Error getting information for a user with ID {id}",
+    )
 
 
 def get_addresses(connection: Connection, id: str):
@@ -26,7 +84,27 @@ def get_addresses(connection: Connection, id: str):
     Returns:
         dict representing user addresses
     """
-    return users_api.get_addresses_v2(connection=connection, id=id).json()
+    return json_helper.response_json(
+        users_api.get_addresses_v2(connection=connection, id=id)
+    )
+
+
+def get_addresses_many(connection: Connection, ids: list[str]):
+    """Get addresses for specified users. Requests are sent concurrently.
+
+    Args:
+        connection: MicroStrategy REST API connection object
+        ids: IDs of the users
+
+    Returns:
+        list of dicts representing user addresses in order of `ids`
+    """
+    return _get_many(
+        connection,
+        users_api.get_addresses_v2_async,
+        ids,
+        msg="Error getting addresses for user with ID {id}",
+    )
 
 
 def get_security_roles(connection: Connection, id: str):
@@ -39,7 +117,27 @@ def get_security_roles(connection: Connection, id: str):
     Returns:
         dict representing user security roles
     """
-    return users_api.get_user_security_roles(connection=connection, id=id).json()
+    return json_helper.response_json(
+        users_api.get_user_security_roles(connection=connection, id=id)
+    )
+
+
+def get_security_roles_many(connection: Connection, ids: list[str]):
+    """Get security roles for specified users. Requests are sent concurrently.
+
+    Args:
+        connection: MicroStrategy REST API connection object
+        ids: IDs of the users
+
+    Returns:
+        list of dicts representing user security roles in order of `ids`
+    """
+    return _get_many(
+        connection,
+        users_api.get_user_security_roles_async,
+        ids,
+        msg="Error getting security roles for a user with ID {id}",
+    )
 
 
 def get_privileges(connection: Connection, id: str):
@@ -52,37 +150,67 @@ def get_privileges(connection: Connection, id: str):
     Returns:
         dict representing user privileges
     """
-    return users_api.get_user_privileges(connection=connection, id=id).json()
+    return json_helper.response_json(
+        users_api.get_user_privileges(connection=connection, id=id)
+    )
+
+
+def get_privileges_many(connection: Connection, ids: list[str]):
+    """Get privileges for specified users. Requests are sent concurrently.
 
+    Args:
+        connection: MicroStrategy REST API connection object
+        ids: IDs of the users
 
-def update(connection: Connection, id: str, body: dict):
+    Returns:
+        list of dicts representing user privileges in order of `ids`
+    """
+    return _get_many(
+        connection,
+        users_api.get_user_privileges_async,
+        ids,
+        msg="Error getting user {id} privileges for a project",
+    )
+
+
+def update(connection: Connection, id: str, body: dict, parse_response: bool = True):
     """Update info for a specified user.
 
     Args:
         connection: MicroStrategy REST API connection object
         id: ID of the user
         body: body of the request
+        parse_response: if False, the body of the response is not decoded
+            and only the success of the request is returned
 
     Returns:
-        dict representing user object
+        dict representing user object or, if `parse_response` is False, True
+        if successfully updated
     """
-    return users_api.update_user_info(connection=connection, id=id, body=body).json()
+    response = users_api.update_user_info(connection=connection, id=id, body=body)
+    return json_helper.response_json(response) if parse_response else response.ok
 
 
-def create(connection: Connection, body: dict, username: str):
+def create(
+    connection: Connection, body: dict, username: str, parse_response: bool = True
+):
     """Create a user.
 
     Args:
         connection: MicroStrategy REST API connection object
         body: body of the request
         username: name of the user, for error purposes only
+        parse_response: if False, the body of the response is not decoded
+            and only the success of the request is returned
 
     Returns:
-        dict representing user object
+        dict representing user object or, if `parse_response` is False, True
+        if successfully created
     """
-    return users_api.create_user(
+    response = users_api.create_user(
         connection=connection, body=body, username=username
-    ).json()
+    )
+    return json_helper.response_json(response) if parse_response else response.ok
 
 
 def get_all(
@@ -119,32 +247,81 @@ def get_all(
     )
 
 
-def create_address(connection: Connection, id: str, body: dict):
+def iter_all(
+    connection: Connection,
+    limit: int,
+    msg: str,
+    name_begins: str,
+    abbreviation_begins: str,
+    filters,
+) -> Iterator[dict]:
+    """Iterate over users. Unlike `get_all`, users are yielded as soon as
+    the chunk containing them is downloaded and only a few chunks are kept in
+    memory at once.
+
+    Args:
+        connection: MicroStrategy REST API connection object
+        limit: limit of users to list
+        msg: optional error message,
+        name_begins: optional filter for name beginning with
+        abbreviation_begins: optional filter for abbreviation beginning with
+        filters: filters
+
+    Returns:
+        iterator of dicts representing users
+    """
+    for users in iter_objects_async(
+        connection=connection,
+        api=users_api.get_users_info,
+        async_api=users_api.get_users_info_async,
+        limit=limit,
+        chunk_size=1000,
+        error_msg=msg,
+        name_begins=name_begins,
+        abbreviation_begins=abbreviation_begins,
+        filters=filters,
+    ):
+        yield from users
+
+
+def create_address(
+    connection: Connection, id: str, body: dict, parse_response: bool = True
+):
     """Create an email user address.
 
     Args:
         connection: MicroStrategy REST API connection object
         id: ID of the user
         body: body of the request
+        parse_response: if False, the body of the response is not decoded
+            and only the success of the request is returned
 
     Returns:
-    created address dictionary
+    created address dictionary or, if `parse_response` is False, True if
+    successfully created
     """
-    return users_api.create_address(connection=connection, id=id, body=body).json()
+    response = users_api.create_address(connection=connection, id=id, body=body)
+    return json_helper.response_json(response) if parse_response else response.ok
 
 
-def create_address_v2(connection: Connection, id: str, body: dict):
+def create_address_v2(
+    connection: Connection, id: str, body: dict, parse_response: bool = True
+):
     """Create a non-email user address.
 
     Args:
         connection: MicroStrategy REST API connection object
         id: ID of the user
         body: body of the request
+        parse_response: if False, the body of the response is not decoded
+            and only the success of the request is returned
 
     Returns:
-        dict representing user addresses
+        dict representing user addresses or, if `parse_response` is False,
+        True if successfully created
     """
-    return users_api.create_address_v2(connection=connection, id=id, body=body).json()
+    response = users_api.create_address_v2(connection=connection, id=id, body=body)
+    return json_helper.response_json(response) if parse_response else response.ok
 
 
 def update_address(connection: Connection, id: str, address_id: str, body: dict):
@@ -191,6 +368,29 @@ def get_security_filters(connection: Connection, id: str, projects: str | list[s
     Returns:
         list of user security filters
     """
-    return users_api.get_security_filters(
-        connection=connection, id=id, projects=projects
-    ).json()
+    return json_helper.response_json(
+        users_api.get_security_filters(connection=connection, id=id, projects=projects)
+    )
+
+
+def get_security_filters_many(
+    connection: Connection, ids: list[str], projects: str | list[str]
+):
+    """Get security filters for specified users. Requests are sent
+    concurrently.
+
+    Args:
+        connection: MicroStrategy REST API connection object
+        ids: IDs of the users
+        projects: IDs of the projects
+
+    Returns:
+        list of user security filters lists in order of `ids`
+    """
+    return _get_many(
+        connection,
+        users_api.get_security_filters_async,
+        ids,
+        msg="Error getting security filters for user with ID {id}.",
+        projects=projects,
+    )
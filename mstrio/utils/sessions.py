@@ -132,7 +132,11 @@ def log_request(logger):
                 logger.debug("method = %s url = '%s'", method_name, log_url)
                 logger.debug("headers = %s", self._session.headers)
                 logger.debug("headers additional = %s", kwargs.get('headers'))
-                logger.debug("body = %s", kwargs.get('json'))
+                # JSON bodies serialized up front are sent as `data`
+                body = kwargs.get('json', kwargs.get('data'))
+                if isinstance(body, bytes):
+                    body = body.decode('utf-8', errors='replace')
+                logger.debug("body = %s", body)
             return func(self, method_name, url=url, endpoint=endpoint, **kwargs)
 
         return wrapper
@@ -1,5 +1,5 @@
 import inspect
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import getattr_static, getmembers
 
 from packaging.version import parse as version_parser
@@ -8,6 +8,13 @@ from mstrio.connection import Connection
 from mstrio.helpers import VersionException
 
 
+@lru_cache(maxsize=64)
+def _parse_version(version_str: str):
+    # versions compared are a handful of constants and the versions of
+    # connected servers, so parsing each of them once is enough
+    return version_parser(version_str)
+
+
 def method_version_handler(version):
     """
     Decorator which can be applied to a function.
@@ -33,7 +40,7 @@ def method_version_handler(version):
                     args[0], '_connection', None
                 )
 
-            if version_parser(connection_obj.iserver_version) < version_parser(version):
+            if _parse_version(connection_obj.iserver_version) < _parse_version(version):
                 raise VersionException(
                     f"Environments must run IServer version {version} or newer. "
                     "Please update your environments to use this feature."
@@ -104,4 +111,19 @@ def is_server_min_version(connection: 'Connection', version_str: str) -> bool:
         True if iServer version is greater or equal to given version.
         False if iServer version is lower than given version.
     """
-    return version_parser(connection.iserver_version) >= version_parser(version_str)
+    return _parse_version(connection.iserver_version) >= _parse_version(version_str)
+
+
+def is_web_min_version(connection: 'Connection', version_str: str) -> bool:
+    """Check if MicroStrategy Web version is greater or equal than given
+    version.
+
+    Args:
+        connection (Connection): MicroStrategy REST API connection object
+        version_str (str): String containing Web version number
+
+    Returns:
+        True if Web version is greater or equal to given version.
+        False if Web version is lower than given version.
+    """
+    return _parse_version(connection.web_version) >= _parse_version(version_str)
@@ -0,0 +1,49 @@
+import json
+import math
+
+import pytest
+
+from mstrio.utils import json_helper
+
+PAYLOAD = {
+    'name': 'Zażółć',
+    'values': [1, 2.5, math.nan, math.inf, -math.inf, None, True],
+    'nested': {'rows': ({'x': math.nan},), 1: 'non-string key'},
+}
+EXPECTED = {
+    'name': 'Zażółć',
+    'values': [1, 2.5, None, None, None, None, True],
+    'nested': {'rows': [{'x': None}], '1': 'non-string key'},
+}
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson':
+        monkeypatch.setattr(json_helper, 'orjson', pytest.importorskip('orjson'))
+    else:
+        monkeypatch.setattr(json_helper, 'orjson', None)
+    return request.param
+
+
+def test_dumps_writes_non_finite_floats_as_null(backend):
+    assert json.loads(json_helper.dumps(PAYLOAD)) == EXPECTED
+
+
+def test_dumps_output_does_not_depend_on_backend(monkeypatch):
+    orjson = pytest.importorskip('orjson')
+    monkeypatch.setattr(json_helper, 'orjson', orjson)
+    fast = json_helper.dumps(PAYLOAD)
+    monkeypatch.setattr(json_helper, 'orjson', None)
+    assert json_helper.dumps(PAYLOAD) == fast
+
+
+def test_dumps_raises_on_circular_reference(backend):
+    circular = []
+    circular.append(circular)
+    with pytest.raises((ValueError, TypeError)):
+        json_helper.dumps(circular)
+
+
+def test_loads_round_trip(backend):
+    assert json_helper.loads(json_helper.dumps(EXPECTED)) == EXPECTED